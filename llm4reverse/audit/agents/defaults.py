@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+defaults.py
+Audit Module - Agents
+=====================
+
+Default tuning values of the enrichment agent, shared by `run_trace`, the
+audit pipeline and both CLIs. Free of heavy imports, so the top-level CLI can
+build its parser without loading langchain.
+"""
+
+# Number of findings grouped into a single agent invocation
+DEFAULT_BATCH_SIZE = 8
+
+# Maximum number of batches in flight at once (keeps us under provider rate limits)
+DEFAULT_CONCURRENCY = 8
+
+# Completion token cap per request; a batch answer rarely needs more
+DEFAULT_MAX_TOKENS = 2048
@@ -4,10 +4,12 @@ endpoint_agent.py
 Audit Module - Agents
 =====================
 
-This module enriches static endpoint findings by orchestrating a LangGraph
-ReAct agent with two custom tools—SymbolLookupTool and CodeSearchTool.  
-The agent analyses each finding, infers missing request metadata
+This module enriches static endpoint findings with a tool-calling chat model
+bound to two custom tools—SymbolLookupTool and CodeSearchTool.  
+The model analyses each finding, infers missing request metadata
 (headers/parameters/payload schema), and returns a single-line JSON summary.
+Reasoning and tool calls are emitted in the same completion, so a finding that
+needs no lookups costs a single LLM round-trip.
 
 All OpenAI traffic is routed through `llm.client.get_chat_llm`, allowing easy
 backend replacement (e.g. corporate API gateway).
@@ -15,66 +17,76 @@ backend replacement (e.g. corporate API gateway).
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-from langchain_core.prompts import PromptTemplate
+import orjson
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.outputs import LLMResult
 
+from llm4reverse.audit.agents.defaults import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_TOKENS,
+)
 from llm4reverse.audit.extractors.regex_extractor import Finding
 from llm4reverse.audit.resolvers.symbol_index import SymbolIndex
 from llm4reverse.llm.client import get_chat_llm
+from llm4reverse.report import write_json
 from llm4reverse.audit.tools.symbol_lookup import _make_symbol_lookup_tool
-from llm4reverse.audit.tools.code_search import _make_code_search_tool
+from llm4reverse.audit.tools.code_search import _make_code_search_many_tool, _make_code_search_tool
 
-# Try to import LangChain agents - prefer create_react_agent (0.3.x recommended)
-try:
-    from langchain.agents import create_react_agent, AgentExecutor
-    HAS_CREATE_REACT_AGENT = True
-except ImportError:
-    HAS_CREATE_REACT_AGENT = False
+logger = logging.getLogger(__name__)
 
-try:
-    from langchain.agents import AgentType, initialize_agent
-    HAS_INITIALIZE_AGENT = True
-except ImportError:
-    HAS_INITIALIZE_AGENT = False
+# Upper bound on tool-calling rounds per batch before the answer is taken as-is
+MAX_TOOL_ROUNDS = 4
 
-logger = logging.getLogger(__name__)
+# Follow-up calls allowed when an answer is cut off by the token cap
+MAX_CONTINUATIONS = 2
+CONTINUE_PROMPT = "Your answer was cut off. Continue exactly where it stopped, without repeating anything."
 
+# Longest snippet sent to the model; longer ones keep their head and tail
+MAX_SNIPPET_CHARS = 800
 
-# Define a custom ReAct JSON prompt compatible with LangChain 0.3.27
-CustomReActPrompt = PromptTemplate.from_template(
-    """You are a security engineer analysing JavaScript frontend code.
-You may call tools to gather additional information.
+# A whole answer wrapped in a Markdown code fence (```json ... ```)
+_CODE_FENCE_RE = re.compile(r"^```[\w-]*\s*\n(.*?)\n?```$", re.DOTALL)
 
-Available tools:
-{tools}
+# Cache routing key for the static prompt prefix (bump when SYSTEM_PROMPT changes)
+PROMPT_CACHE_KEY = "llm4reverse-endpoint-v1"
 
-Tool names:
-{tool_names}
+# Enrichment results keyed by `_cache_key`, shared by every run in this
+# process as a bounded LRU (least recently used entries are evicted first)
+_ENRICH_CACHE_SIZE = 4096
+_ENRICH_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
-Use the following format for reasoning:
-Thought: describe your thought
-Action: one of [{tool_names}]
-Action Input: the input for the action
-Observation: the result of the action
-… (this Thought/Action/Action Input/Observation can repeat N times)
-Thought: I now know the final answer
+# One event loop per thread, kept open across `run_trace` calls: the cached
+# chat client (see `get_chat_llm`) pools async connections bound to the loop
+# that opened them, and `asyncio.run` would close that loop after every call
+_LOOPS = threading.local()
 
-For the following endpoint, describe:
+# Output-format instructions sent as the system message of every request.
+# Kept constant and ahead of the per-batch message so the provider can reuse
+# the cached prefix (system prompt + tool catalog) across requests.
+SYSTEM_PROMPT = """You are a security engineer analysing JavaScript frontend code.
+You may call tools to gather additional information.
+
+For each of the following endpoints, describe:
 - Missing URL parts (e.g. baseURL variables)
 - Required headers or auth tokens
 - Body/query parameters with types
 
-Return the final answer as a single-line JSON with keys:
-`url`, `method`, `headers`, `params`, `body`, `confidence`.
-
-Question: {input}
-{agent_scratchpad}"""
-)
+Endpoints are numbered `[idx]`. Return the final answer as a single-line
+JSON array with one object per endpoint, each with keys:
+`idx`, `url`, `method`, `headers`, `params`, `body`, `confidence`."""
 
 
 class TraceCallback(BaseCallbackHandler):
@@ -105,18 +117,286 @@ class TraceCallback(BaseCallbackHandler):
         })
 
 
+def _format_batch(batch: List[Finding]) -> str:
+    """
+    Render a batch of findings as numbered entries for the agent prompt.
+
+    Args:
+        batch (List[Finding]): Findings to include in a single request.
+
+    Returns:
+        str: Prompt text with one `[idx] File:... Code:...` entry per finding.
+    """
+    parts = [
+        f"[{idx}] File: {f.file}:{f.line}\nCode:\n{_clamp_snippet(f.snippet)}\n"
+        for idx, f in enumerate(batch)
+    ]
+    return "\n".join(parts)
+
+
+def _clamp_snippet(snippet: str, max_chars: int = MAX_SNIPPET_CHARS) -> str:
+    """
+    Bound a snippet's length so prompt size (and time to first token) stays flat.
+
+    Args:
+        snippet (str): Code excerpt of a finding.
+        max_chars (int): Maximum length to keep.
+
+    Returns:
+        str: The snippet, or its head and tail joined by an ellipsis.
+    """
+    if len(snippet) <= max_chars:
+        return snippet
+    half = max_chars // 2
+    return snippet[:half] + "…" + snippet[-half:]
+
+
+def _strip_code_fence(text: str) -> str:
+    """
+    Unwrap an answer the model put in a Markdown code fence.
+
+    Args:
+        text (str): Stripped model answer.
+
+    Returns:
+        str: The fenced content, or `text` unchanged if it is not fenced.
+    """
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1).strip() if match else text
+
+
+def _apply_enrichment(f: Finding, parsed: Dict) -> None:
+    """
+    Update a finding in place with the metadata returned by the agent.
+
+    Args:
+        f (Finding): Finding to update.
+        parsed (Dict): Enrichment object parsed from the agent output.
+    """
+    f.url = parsed.get("url", f.url)
+    f.method = parsed.get("method", f.method)
+    f.headers = parsed.get("headers")
+    f.params = parsed.get("params")
+    f.body = parsed.get("body")
+    f.confidence = parsed.get("confidence", f.confidence or 0.9)
+
+
+def _cache_key(f: Finding, model_name: str) -> str:
+    """
+    Hash the parts of a finding that determine its enrichment.
+
+    Must be computed before the finding is enriched, since enrichment rewrites
+    the URL and method.
+
+    Args:
+        f (Finding): Finding to key.
+        model_name (str): Model that produced (or will produce) the enrichment.
+
+    Returns:
+        str: Hex digest identifying identical call sites.
+    """
+    raw = f"{model_name}|{f.url}|{f.method}|{f.snippet.strip()}"
+    return hashlib.blake2b(raw.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+
+
+def _lru_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up an enrichment in the in-process LRU, marking it recently used.
+
+    Args:
+        key (str): Cache key (see `_cache_key`).
+
+    Returns:
+        Optional[Dict[str, Any]]: Cached enrichment, or None.
+    """
+    item = _ENRICH_CACHE.get(key)
+    if item is not None:
+        _ENRICH_CACHE.move_to_end(key)
+    return item
+
+
+def _lru_put(key: str, item: Dict[str, Any]) -> None:
+    """
+    Store an enrichment in the in-process LRU, evicting the oldest if full.
+
+    Args:
+        key (str): Cache key (see `_cache_key`).
+        item (Dict[str, Any]): Enrichment object.
+    """
+    _ENRICH_CACHE[key] = item
+    _ENRICH_CACHE.move_to_end(key)
+    while len(_ENRICH_CACHE) > _ENRICH_CACHE_SIZE:
+        _ENRICH_CACHE.popitem(last=False)
+
+
+def _load_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read a persisted enrichment cache.
+
+    Entries written under a different PROMPT_CACHE_KEY are ignored, since the
+    prompt that produced them has changed.
+
+    Args:
+        cache_path (Path): JSON cache file written by `_save_cache`.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Entries keyed by `_cache_key` (empty if the
+            file is missing, unreadable or stale).
+    """
+    if not cache_path.is_file():
+        return {}
+    try:
+        raw = cache_path.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # `write_json` falls back to `json` for values orjson rejects
+            data = json.loads(raw)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable enrichment cache %s: %s", cache_path, exc)
+        return {}
+    if not (isinstance(data, dict) and data.get("version") == PROMPT_CACHE_KEY):
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    logger.info("Loaded %d cached enrichments from %s", len(entries), cache_path)
+    return entries
+
+
+def _save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Persist the enrichment cache of one project.
+
+    Args:
+        cache_path (Path): Destination JSON file.
+        entries (Dict[str, Dict[str, Any]]): Entries keyed by `_cache_key`.
+    """
+    try:
+        write_json(cache_path, {"version": PROMPT_CACHE_KEY, "entries": entries})
+    except OSError as exc:
+        logger.warning("Could not write enrichment cache %s: %s", cache_path, exc)
+
+
+def _run_async(coro: Any) -> Any:
+    """
+    Run a coroutine to completion on this thread's long-lived event loop.
+
+    Args:
+        coro (Any): Coroutine to run.
+
+    Returns:
+        Any: The coroutine's result.
+    """
+    loop = getattr(_LOOPS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _LOOPS.loop = asyncio.new_event_loop()
+        atexit.register(loop.close)
+    return loop.run_until_complete(coro)
+
+
+def _message_text(message: BaseMessage) -> str:
+    """
+    Return the textual content of a chat message.
+
+    Args:
+        message (BaseMessage): Message returned by the chat model.
+
+    Returns:
+        str: Plain text content (text blocks are joined for list content).
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block) for block in content
+    )
+
+
+async def _ainvoke_with_tools(
+    llm_with_tools: Any,
+    tools_by_name: Dict[str, Any],
+    messages: List[BaseMessage],
+    config: Dict[str, Any],
+) -> str:
+    """
+    Run one completion, executing requested tool calls locally until the model answers.
+
+    An answer truncated by the token cap is completed with up to
+    MAX_CONTINUATIONS follow-up calls, and the parts are concatenated. An
+    answer that still requests tools (round limit reached) is not continued:
+    the API rejects an assistant message whose tool calls go unanswered.
+
+    Args:
+        llm_with_tools (Any): Chat model with tools bound.
+        tools_by_name (Dict[str, Any]): Tools keyed by name.
+        messages (List[BaseMessage]): Conversation so far; extended in place.
+        config (Dict[str, Any]): Runnable config (callbacks).
+
+    Returns:
+        str: Text content of the final completion.
+    """
+    response = await llm_with_tools.ainvoke(messages, config=config)
+    rounds = 0
+    while response.tool_calls and rounds < MAX_TOOL_ROUNDS:
+        messages.append(response)
+        for call in response.tool_calls:
+            tool = tools_by_name.get(call["name"])
+            if tool is None:
+                messages.append(ToolMessage(content=f"Unknown tool: {call['name']}", tool_call_id=call["id"]))
+                continue
+            messages.append(await tool.ainvoke(call))
+        response = await llm_with_tools.ainvoke(messages, config=config)
+        rounds += 1
+    if response.tool_calls:
+        logger.warning("Tool round limit (%d) reached; using last answer as-is", MAX_TOOL_ROUNDS)
+
+    text = _message_text(response)
+    continuations = 0
+    while (
+        not response.tool_calls
+        and response.response_metadata.get("finish_reason") == "length"
+        and continuations < MAX_CONTINUATIONS
+    ):
+        messages.extend([response, HumanMessage(content=CONTINUE_PROMPT)])
+        response = await llm_with_tools.ainvoke(messages, config=config)
+        text += _message_text(response)
+        continuations += 1
+    return text
+
+
 def run_trace(
     findings: List[Finding],
     index: SymbolIndex,
     model_name: Optional[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache_path: Optional[Path] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
 ) -> Tuple[List[Finding], List[Dict[str, str]]]:
     """
-    Enrich every Finding via a LangGraph ReAct agent.
+    Enrich every Finding via a tool-calling chat model.
+
+    Findings are sent to the model in batches of `batch_size`, so the system
+    prompt and tool rounds are paid once per batch rather than once per finding.
+    Up to `concurrency` batches are in flight at the same time.
+
+    Identical call sites (same URL, method and snippet) are enriched once:
+    results are kept by content hash in a bounded in-process LRU and, when
+    `cache_path` is given, in that file, so repeats – within this run or a
+    later one – cost no LLM call. The file only receives entries it already
+    held or that were used for `findings`; other projects' results never
+    leak into it.
 
     Args:
         findings (List[Finding]): List of raw endpoint findings.
         index (SymbolIndex): Prebuilt symbol index for variable resolution.
         model_name (Optional[str]): Name of the OpenAI model to use; falls back to .env default.
+        batch_size (int): Number of findings enriched per agent invocation.
+        concurrency (int): Maximum number of concurrent LLM requests.
+        cache_path (Optional[Path]): JSON file used to persist the cache
+            between runs; None keeps it in memory only.
+        max_tokens (int): Completion token cap per request.
 
     Returns:
         Tuple[List[Finding], List[Dict[str, str]]]:
@@ -126,156 +406,204 @@ def run_trace(
     logger.info("Starting LLM enrichment (model=%s)", model_name or "[env default]")
 
     # Instantiate the ChatOpenAI client
-    llm = get_chat_llm(model_name=model_name, temperature=0.0)
+    llm = get_chat_llm(
+        model_name=model_name,
+        temperature=0.0,
+        prompt_cache_key=PROMPT_CACHE_KEY,
+        max_tokens=max_tokens,
+    )
+
+    # Entries persisted for this project: those already in its cache file,
+    # plus those used or produced for `findings` below
+    entries = _load_cache(cache_path) if cache_path is not None else {}
+
+    # Serve cached sites; group the rest so each unique site is enriched once
+    resolved_model = getattr(llm, "model_name", None) or model_name or ""
+    pending: Dict[str, List[Finding]] = {}
+    for f in findings:
+        key = _cache_key(f, resolved_model)
+        cached = entries.get(key)
+        if cached is None:
+            cached = _lru_get(key)
+        if cached is not None:
+            entries[key] = cached
+            _lru_put(key, cached)
+            _apply_enrichment(f, cached)
+        else:
+            pending.setdefault(key, []).append(f)
+    to_enrich = [group[0] for group in pending.values()]
+    logger.info(
+        "Enrichment cache: %d hit(s), %d unique site(s) to enrich",
+        len(findings) - sum(len(group) for group in pending.values()),
+        len(to_enrich),
+    )
 
     # Prepare custom tools for the agent
     tools = [
         _make_symbol_lookup_tool(index),
         _make_code_search_tool(index),
+        _make_code_search_many_tool(index),
     ]
 
-    # Attach trace callback to collect assistant outputs
-    tracer = TraceCallback()
-    try:
-        from langchain_core.callbacks import CallbackManager
-        cb_manager = CallbackManager([tracer])
-        logger.debug("CallbackManager initialized.")
-    except Exception as exc:
-        logger.warning("Could not create CallbackManager – %s", exc)
-        cb_manager = None
-
-    # Build agent: prefer create_react_agent with AgentExecutor (0.3.x recommended)
-    # Fallback to legacy initialize_agent if needed
-    agent_executor = None
-    use_legacy_agent = False
-    
-    if HAS_CREATE_REACT_AGENT:
-        try:
-            # Primary: use create_react_agent with AgentExecutor (recommended for 0.3.x)
-            agent = create_react_agent(llm=llm, tools=tools, prompt=CustomReActPrompt)
-            agent_executor = AgentExecutor(
-                agent=agent, 
-                tools=tools, 
-                verbose=False, 
-                handle_parsing_errors=True
+    # Bind tools so reasoning and tool calls come back in a single completion
+    llm_with_tools = llm.bind_tools(tools, tool_choice="auto")
+    tools_by_name = {t.name: t for t in tools}
+
+    batch_size = max(1, batch_size)
+    trace_events: List[Dict[str, str]] = []
+    results: Dict[str, Dict[str, Any]] = {}
+    if to_enrich:
+        trace_events = _run_async(
+            _arun_trace(
+                to_enrich, list(pending), results, llm_with_tools, tools_by_name, batch_size, concurrency
             )
-            use_legacy_agent = False
-            logger.debug("Using create_react_agent with AgentExecutor (primary).")
-        except Exception as exc_create:
-            logger.warning("create_react_agent failed: %s, trying fallback", exc_create)
-            if HAS_INITIALIZE_AGENT:
-                try:
-                    # Fallback: use legacy initialize_agent
-                    agent_executor = initialize_agent(
-                        tools=tools,
-                        llm=llm,
-                        agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                        verbose=False,
-                        handle_parsing_errors=True,
-                    )
-                    use_legacy_agent = True
-                    logger.debug("Using initialize_agent (fallback).")
-                except Exception as exc_init:
-                    logger.error("Both agent creation methods failed. create_err=%s init_err=%s", exc_create, exc_init)
-                    raise
-            else:
-                logger.error("create_react_agent failed and initialize_agent not available: %s", exc_create)
-                raise
-    elif HAS_INITIALIZE_AGENT:
-        try:
-            # Only fallback available
-            agent_executor = initialize_agent(
-                tools=tools,
-                llm=llm,
-                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                verbose=False,
-                handle_parsing_errors=True,
-            )
-            use_legacy_agent = True
-            logger.debug("Using initialize_agent (only option available).")
-        except Exception as exc_init:
-            logger.error("initialize_agent failed: %s", exc_init)
-            raise
-    else:
-        raise ImportError("Neither create_react_agent nor initialize_agent are available. Please check LangChain installation.")
+        )
 
-    enriched: List[Finding] = []
+    # Repeated sites reuse the enrichment of the first one
+    for key, item in results.items():
+        entries[key] = item
+        _lru_put(key, item)
+        for f in pending[key][1:]:
+            _apply_enrichment(f, item)
 
-    # Iterate through each finding and invoke the agent
-    for f in findings:
-        # Construct the user message including file context and snippet
-        user_msg = (
-            f"File: {f.file}:{f.line}\n"
-            f"Code:\n{f.snippet}\n"
-            "Think step-by-step. Use tools when needed."
+    if cache_path is not None:
+        _save_cache(cache_path, entries)
+
+    logger.info("Completed enrichment for %d findings", len(findings))
+    return findings, trace_events
+
+
+async def _arun_trace(
+    findings: List[Finding],
+    keys: List[str],
+    results: Dict[str, Dict[str, Any]],
+    llm_with_tools: Any,
+    tools_by_name: Dict[str, Any],
+    batch_size: int,
+    concurrency: int,
+) -> List[Dict[str, str]]:
+    """
+    Enrich all batches concurrently, bounded by a semaphore.
+
+    Args:
+        findings (List[Finding]): Findings to enrich (updated in place).
+        keys (List[str]): Cache key of each finding, in the same order.
+        results (Dict[str, Dict[str, Any]]): Receives each parsed enrichment
+            under its cache key.
+        llm_with_tools (Any): Chat model with tools bound.
+        tools_by_name (Dict[str, Any]): Tools keyed by name.
+        batch_size (int): Number of findings per request.
+        concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        List[Dict[str, str]]: Trace events, ordered by batch.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+    tasks = [
+        asyncio.create_task(
+            _enrich_batch(
+                findings[start:start + batch_size],
+                keys[start:start + batch_size],
+                results,
+                start,
+                len(findings),
+                llm_with_tools,
+                tools_by_name,
+                sem,
+            )
         )
+        for start in range(0, len(findings), batch_size)
+    ]
+    traces = await asyncio.gather(*tasks)
+    return [event for events in traces for event in events]
+
+
+async def _enrich_batch(
+    batch: List[Finding],
+    keys: List[str],
+    results: Dict[str, Dict[str, Any]],
+    start: int,
+    total: int,
+    llm_with_tools: Any,
+    tools_by_name: Dict[str, Any],
+    sem: asyncio.Semaphore,
+) -> List[Dict[str, str]]:
+    """
+    Enrich one batch of findings in place.
 
-        logger.info("Enriching %s:%d", f.file, f.line)
-        try:
-            # Invoke the agent with proper configuration
-            raw = None
-            if use_legacy_agent:
-                # Legacy initialize_agent uses .run() method
-                raw = agent_executor.run(user_msg)
-            else:
-                # AgentExecutor path - use invoke
-                raw = agent_executor.invoke({"input": user_msg})
-
-            # Extract the JSON string from agent output
-            if isinstance(raw, dict):
-                result_text = raw.get("output", "")
-                # Also check for intermediate_steps or other keys
-                if not result_text and "intermediate_steps" in raw:
-                    logger.debug("Found intermediate_steps in response: %s", raw.get("intermediate_steps", []))
-                if not result_text:
-                    result_text = raw.get("answer", raw.get("result", str(raw)))
-            else:
-                result_text = str(raw)
+    Args:
+        batch (List[Finding]): Findings sent in a single request.
+        keys (List[str]): Cache key of each finding in `batch`.
+        results (Dict[str, Dict[str, Any]]): Receives each parsed enrichment
+            under its cache key.
+        start (int): Offset of the batch within all findings (for logging).
+        total (int): Total number of findings (for logging).
+        llm_with_tools (Any): Chat model with tools bound.
+        tools_by_name (Dict[str, Any]): Tools keyed by name.
+        sem (asyncio.Semaphore): Limits the number of concurrent requests.
 
+    Returns:
+        List[Dict[str, str]]: Assistant messages recorded for this batch.
+    """
+    # Attach trace callback to collect assistant outputs
+    tracer = TraceCallback()
+    config = {"callbacks": [tracer]}
+
+    # Construct the user message including file context and snippet of each finding
+    user_msg = _format_batch(batch)
+
+    async with sem:
+        logger.info("Enriching findings %d-%d of %d", start + 1, start + len(batch), total)
+        try:
+            messages: List[BaseMessage] = [
+                SystemMessage(content=SYSTEM_PROMPT),
+                HumanMessage(content=user_msg),
+            ]
+            result_text = await _ainvoke_with_tools(llm_with_tools, tools_by_name, messages, config)
             result_text = result_text.strip()
             logger.debug("Agent output (len=%d): %s", len(result_text), result_text[:200] if result_text else "empty")
 
-            # Parse JSON or fallback to raw text
+            # Parse JSON (models often fence it) or fallback to raw text
             try:
-                parsed = json.loads(result_text)
+                parsed = json.loads(_strip_code_fence(result_text))
             except json.JSONDecodeError:
                 logger.warning(
-                    "Non-JSON output for %s:%d; storing raw text.", f.file, f.line
+                    "Non-JSON output for %s:%d; storing raw text.", batch[0].file, batch[0].line
                 )
-                parsed = {"raw": result_text}
+                parsed = None
 
-            # Update the finding with enriched metadata
+            # A batch of one may come back as a bare object instead of an array
             if isinstance(parsed, dict):
-                f.url = parsed.get("url", f.url)
-                f.method = parsed.get("method", f.method)
-                f.snippet += f"\n/* LLM Enrich: {json.dumps(parsed, ensure_ascii=False)} */"
-                f.confidence = parsed.get("confidence", f.confidence or 0.9)
+                parsed = [dict(parsed, idx=parsed.get("idx", 0))]
+
+            # Scatter enrichments back onto the findings they refer to
+            if isinstance(parsed, list):
+                for item in parsed:
+                    if not isinstance(item, dict):
+                        continue
+                    try:
+                        idx = int(item.get("idx"))
+                    except (TypeError, ValueError):
+                        continue
+                    if 0 <= idx < len(batch):
+                        # `idx` is only meaningful within this batch
+                        item = {k: v for k, v in item.items() if k != "idx"}
+                        results[keys[idx]] = item
+                        _apply_enrichment(batch[idx], item)
             else:
-                f.snippet += f"\n/* LLM Raw: {result_text} */"
-
-            enriched.append(f)
-
-        except Exception as exc:
-            # Log and preserve the original finding on failure
-            import traceback
-            import sys
-            error_type = type(exc).__name__
-            error_msg = str(exc) if exc else "Unknown error"
-            exc_info = sys.exc_info()
-            full_traceback = "".join(traceback.format_exception(*exc_info))
-            logger.warning(
-                "Enrichment failed on %s:%d – %s: %s", 
-                f.file, f.line, error_type, error_msg
+                # Keep the raw answer once, on the first finding of the batch
+                batch[0].enrichment.append(result_text)
+                note = f"Raw batch answer kept with {batch[0].file}:{batch[0].line}"
+                for f in batch[1:]:
+                    f.enrichment.append(note)
+
+        except Exception:
+            # Log and preserve the original findings on failure
+            logger.exception(
+                "Enrichment failed on batch starting at %s:%d", batch[0].file, batch[0].line
             )
-            # Print full traceback to stderr for debugging (in addition to logging)
-            print(f"ERROR in {f.file}:{f.line} - {error_type}: {error_msg}", file=sys.stderr)
-            print(full_traceback, file=sys.stderr)
-            enriched.append(f)
-
-    # Extract the collected trace events
-    trace_events = tracer.events
-    logger.info("Completed enrichment for %d findings", len(enriched))
-    return enriched, trace_events
+
+    return tracer.events
 
 
 def _quick_test() -> None:
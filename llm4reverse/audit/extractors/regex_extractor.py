@@ -18,9 +18,13 @@ Exports
 from __future__ import annotations
 
 import logging
+import mmap
 import re
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Sequence
+import sys
+from dataclasses import dataclass, asdict, field
+from typing import Any, AnyStr, List, Optional, Pattern, Sequence, Set, Union
+
+from llm4reverse.audit.utils import LineIndex
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +32,12 @@ logger = logging.getLogger(__name__)
 # --------------------------------------------------------------------------- #
 # Data structures
 # --------------------------------------------------------------------------- #
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """
     A potential call site to a backend endpoint.
+
+    Slotted: one instance is allocated per regex match across the whole tree.
     """
     type: str                # 'http', 'graphql', 'ws'
     method: Optional[str]    # GET / POST / ...
@@ -40,6 +46,10 @@ class Finding:
     line: int                # 1‑based line number
     snippet: str             # Surrounding code context
     confidence: float = 0.6  # Heuristic score
+    headers: Any = None      # Request headers inferred by the LLM
+    params: Any = None       # Query/body parameters inferred by the LLM
+    body: Any = None         # Payload schema inferred by the LLM
+    enrichment: List[str] = field(default_factory=list)  # Unparseable LLM output, kept apart from the snippet
 
 
 # --------------------------------------------------------------------------- #
@@ -49,18 +59,38 @@ _RAW_URL_PATTERNS: Sequence[str] = (
     r"(?P<url>https?://[a-zA-Z0-9_\-./:?=&%#]+)",
     r"(?P<url>/api/[a-zA-Z0-9_\-./:?=&%#]+)",
 )
+# Quoted URLs are capped at 2048 characters: with an unbounded `.+?`, a call
+# whose closing quote never comes rescans the rest of the line on every
+# attempt, which is quadratic on single-line minified bundles.
 _HTTP_PATTERNS: Sequence[str] = (
-    r"fetch\(\s*(['\"])(?P<url>.+?)\1",
-    r"axios\.(?P<method>get|post|put|delete|patch)\(\s*(['\"])(?P<url>.+?)\3",
+    r"fetch\(\s*(['\"])(?P<url>.{1,2048}?)\1",
+    r"axios\.(?P<method>get|post|put|delete|patch)\(\s*(['\"])(?P<url>.{1,2048}?)\2",
 )
 _GRAPHQL_HINTS: Sequence[str] = (r"/graphql\b", r"operationName\s*:")
-_WS_PATTERNS: Sequence[str] = (r"new\s+WebSocket\(\s*(['\"])(?P<url>ws[s]?://.+?)\1",)
+_WS_PATTERNS: Sequence[str] = (r"new\s+WebSocket\(\s*(['\"])(?P<url>ws[s]?://.{1,2048}?)\1",)
+
+# Compiled once at import. Each pattern keeps its own pass: a single fused
+# alternation loses `re`'s literal-prefix scan and benchmarks slower. This
+# holds for the GraphQL hints too – a joined `/graphql\b|operationName\s*:`
+# is ~5x slower on files without GraphQL, the common case, so `any()` over the
+# two searches stays.
+_RAW_URL_RE: Sequence[Pattern[str]] = tuple(re.compile(p, re.IGNORECASE) for p in _RAW_URL_PATTERNS)
+_HTTP_RE: Sequence[Pattern[str]] = tuple(re.compile(p, re.IGNORECASE) for p in _HTTP_PATTERNS)
+_GRAPHQL_RE: Sequence[Pattern[str]] = tuple(re.compile(p) for p in _GRAPHQL_HINTS)
+_WS_RE: Sequence[Pattern[str]] = tuple(re.compile(p, re.IGNORECASE) for p in _WS_PATTERNS)
+
+# Bytes twins of the patterns above (all ASCII), used to scan mmap'd files
+# without decoding them first.
+_RAW_URL_BRE: Sequence[Pattern[bytes]] = tuple(re.compile(p.encode(), re.IGNORECASE) for p in _RAW_URL_PATTERNS)
+_HTTP_BRE: Sequence[Pattern[bytes]] = tuple(re.compile(p.encode(), re.IGNORECASE) for p in _HTTP_PATTERNS)
+_GRAPHQL_BRE: Sequence[Pattern[bytes]] = tuple(re.compile(p.encode()) for p in _GRAPHQL_HINTS)
+_WS_BRE: Sequence[Pattern[bytes]] = tuple(re.compile(p.encode(), re.IGNORECASE) for p in _WS_PATTERNS)
 
 
 # --------------------------------------------------------------------------- #
 # Public API
 # --------------------------------------------------------------------------- #
-def extract_endpoints(text: str, file_path: str) -> List[Finding]:
+def extract_endpoints(text: Union[str, bytes, mmap.mmap], file_path: str) -> List[Finding]:
     """
     Extract potential API endpoints from JavaScript/TypeScript source code.
 
@@ -71,44 +101,70 @@ def extract_endpoints(text: str, file_path: str) -> List[Finding]:
     - Raw URLs (http/https)
     - Relative API paths (/api/...)
 
+    `text` may also be raw bytes (or an `mmap` of the file); only the matched
+    URL and its excerpt are then decoded, as UTF-8 with undecodable bytes dropped.
+
     Args:
-        text (str): Source code to analyze.
+        text (Union[str, bytes, mmap.mmap]): Source code to analyze.
         file_path (str): Absolute or relative file path (for logging).
 
+    Duplicates (same type, method, URL, file and line) are dropped as they are
+    found, keeping the first occurrence.
+
     Returns:
         List[Finding]: List of extracted raw endpoint candidates.
     """
+    # Keyed like `deduplicate_findings`; only the first hit of a key is kept,
+    # and a Finding is only built for it
     results: List[Finding] = []
+    seen: Set[tuple] = set()
+    lines = LineIndex(text)
+
+    if isinstance(text, str):
+        http_re, raw_url_re, graphql_re, ws_re = _HTTP_RE, _RAW_URL_RE, _GRAPHQL_RE, _WS_RE
+    else:
+        http_re, raw_url_re, graphql_re, ws_re = _HTTP_BRE, _RAW_URL_BRE, _GRAPHQL_BRE, _WS_BRE
 
     try:
-        # Match explicit HTTP request patterns (fetch, axios)
-        for pattern in _HTTP_PATTERNS:
-            for match in re.finditer(pattern, text, flags=re.IGNORECASE):
-                line_no = text.count("\n", 0, match.start()) + 1
-                url = match.group("url")
-                method = match.groupdict().get("method")
-                snippet = _excerpt(text, match.start(), match.end())
-                results.append(Finding("http", method, url, file_path, line_no, snippet, 0.8))
+        # Match explicit HTTP request patterns (fetch, axios). The excerpt is
+        # only cut and decoded for a key not seen before.
+        for rx in http_re:
+            has_method = "method" in rx.groupindex
+            for match in rx.finditer(text):
+                line_no = lines.line_of(match.start())
+                url = _to_str(match.group("url"))
+                method = _to_str(match.group("method")) if has_method else None
+                key = ("http", method, url, file_path, line_no)
+                if key not in seen:
+                    seen.add(key)
+                    snippet = _excerpt(text, match.start(), match.end())
+                    results.append(Finding("http", method, url, file_path, line_no, snippet, 0.8))
 
         # Match raw URLs (high recall for minified JS)
-        for pattern in _RAW_URL_PATTERNS:
-            for match in re.finditer(pattern, text, flags=re.IGNORECASE):
-                line_no = text.count("\n", 0, match.start()) + 1
-                url = match.group("url")
-                snippet = _excerpt(text, match.start(), match.end())
-                results.append(Finding("http", "GET", url, file_path, line_no, snippet, 0.6))
+        for rx in raw_url_re:
+            for match in rx.finditer(text):
+                line_no = lines.line_of(match.start())
+                url = _to_str(match.group("url"))
+                key = ("http", "GET", url, file_path, line_no)
+                if key not in seen:
+                    seen.add(key)
+                    snippet = _excerpt(text, match.start(), match.end())
+                    results.append(Finding("http", "GET", url, file_path, line_no, snippet, 0.6))
 
         # Match GraphQL hints (mark file if detected)
-        if any(re.search(h, text) for h in _GRAPHQL_HINTS):
+        if any(rx.search(text) for rx in graphql_re):
             results.append(Finding("graphql", None, "", file_path, 1, "", 0.5))
 
         # Match WebSocket endpoints
-        for pattern in _WS_PATTERNS:
-            for match in re.finditer(pattern, text, flags=re.IGNORECASE):
-                line_no = text.count("\n", 0, match.start()) + 1
-                url = match.group("url")
-                snippet = _excerpt(text, match.start(), match.end())
-                results.append(Finding("ws", None, url, file_path, line_no, snippet, 0.8))
+        for rx in ws_re:
+            for match in rx.finditer(text):
+                line_no = lines.line_of(match.start())
+                url = _to_str(match.group("url"))
+                key = ("ws", None, url, file_path, line_no)
+                if key not in seen:
+                    seen.add(key)
+                    snippet = _excerpt(text, match.start(), match.end())
+                    results.append(Finding("ws", None, url, file_path, line_no, snippet, 0.8))
 
         # Log results
         if results:
@@ -146,12 +202,35 @@ def deduplicate_findings(findings: List[Finding]) -> List[Finding]:
 # --------------------------------------------------------------------------- #
 # Helpers
 # --------------------------------------------------------------------------- #
-def _excerpt(text: str, start: int, end: int, ctx: int = 50) -> str:
+def _to_str(value: Optional[AnyStr]) -> Optional[str]:
+    """
+    Decode a bytes match group and intern it; None passes through unchanged.
+
+    URLs and methods repeat across call sites and files, so interning lets
+    every Finding share one string per distinct value.
+
+    Args:
+        value (Optional[AnyStr]): Matched group.
+
+    Returns:
+        Optional[str]: Text value.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = value.decode("utf-8", errors="ignore")
+    return sys.intern(value)
+
+
+def _excerpt(text: Union[str, bytes, mmap.mmap], start: int, end: int, ctx: int = 50) -> str:
     """
     Return `ctx` characters before/after as code excerpt.
 
+    For bytes input the window is measured in bytes and line endings are
+    normalised to `\n`, matching what text-mode reads produce.
+
     Args:
-        text (str): Source code text.
+        text (Union[str, bytes, mmap.mmap]): Source code text.
         start (int): Match start position.
         end (int): Match end position.
         ctx (int): Context characters, default 50.
@@ -159,4 +238,7 @@ def _excerpt(text: str, start: int, end: int, ctx: int = 50) -> str:
     Returns:
         str: Code excerpt.
     """
-    return text[max(0, start - ctx): min(len(text), end + ctx)]
+    excerpt = text[max(0, start - ctx): min(len(text), end + ctx)]
+    if isinstance(excerpt, str):
+        return excerpt
+    return excerpt.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
@@ -10,8 +10,8 @@ Flow
 ----
 1. Walk a directory tree and collect source files.
 2. Extract possible endpoints (HTTP / GraphQL / WS) via regex heuristics.
-3. Build an index of symbols for cross‑file reasoning.
-4. (Optional) Ask an LLM agent (ReAct) to enrich each finding with
+3. Build an index of symbols for cross‑file reasoning (from the same read).
+4. (Optional) Ask a tool-calling LLM to enrich each finding with
    headers / params / payload schema, using the index as a tool.
 5. Persist a JSON + Markdown report and the full LLM trace.
 
@@ -21,29 +21,85 @@ python -m llm4reverse.audit.pipeline \
     --path ./webapp \
     --include .js .ts \
     --exclude node_modules tests \
+    --batch-size 8
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import mmap
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional, Sequence, Set
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from llm4reverse.audit.extractors.regex_extractor import (
     Finding,
-    deduplicate_findings,
     extract_endpoints,
 )
-from llm4reverse.audit.resolvers.symbol_index import SymbolIndex
+from llm4reverse.audit.resolvers.symbol_index import SymbolIndex, SymbolRef
 from llm4reverse.audit.scanner import iter_source_files
+from llm4reverse.audit.utils import is_static_resource, looks_minified
 from llm4reverse.audit import report as report_writer
+from llm4reverse.report import write_json
+from llm4reverse.audit.agents.defaults import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_TOKENS,
+)
 from llm4reverse.audit.agents.endpoint_agent import run_trace
 
 logger = logging.getLogger(__name__)
 
+# Enrichment cache persisted in the audited directory
+CACHE_FILENAME = ".llm4reverse_cache.json"
+
+# Below this many files the process pool start-up costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Files handed to each worker per round-trip
+_SCAN_CHUNKSIZE = 32
+
+
+# --------------------------------------------------------------------------- #
+# Extraction worker
+# --------------------------------------------------------------------------- #
+def _scan_file(fp: str, skip_minified: bool = False) -> Optional[Tuple[List[Finding], List[SymbolRef]]]:
+    """
+    Read one source file once and extract both its endpoints and its symbols.
+
+    Endpoints and symbol definitions are both matched on the same read-only
+    `mmap`; only files that define symbols are ever decoded. Defined at module
+    level so it can be pickled into worker processes.
+
+    Args:
+        fp (str): Path of the file to scan.
+        skip_minified (bool): Skip files that look minified (see
+            `looks_minified`).
+
+    Returns:
+        Optional[Tuple[List[Finding], List[SymbolRef]]]: Findings and symbol
+            definitions in this file (both empty if the file is unreadable),
+            or None if it was skipped as minified.
+    """
+    try:
+        with open(fp, "rb") as fh:
+            # Zero-length files cannot be mapped
+            if os.fstat(fh.fileno()).st_size == 0:
+                return extract_endpoints(b"", fp), []
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if skip_minified and looks_minified(os.path.basename(fp), mm):
+                    return None
+                return extract_endpoints(mm, fp), SymbolIndex.scan(fp, mm)
+    except Exception as exc:
+        logger.error("Failed reading %s: %s", fp, exc)
+        return [], []
+
 
 # --------------------------------------------------------------------------- #
 # Core orchestration
@@ -52,6 +108,11 @@ def run_static_audit(
     path: str,
     include: Sequence[str],
     exclude: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: bool = True,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    skip_minified: bool = False,
 ) -> None:
     """
     Perform a static audit and LLM enrichment.
@@ -60,6 +121,12 @@ def run_static_audit(
         path (str): Root directory to analyse.
         include (Sequence[str]): File extensions to include (e.g. ['.js']).
         exclude (Optional[Sequence[str]]): Directory names to skip.
+        batch_size (int): Number of findings enriched per agent invocation.
+        concurrency (int): Maximum number of concurrent LLM requests.
+        cache (bool): Reuse and persist enrichments in `<path>/.llm4reverse_cache.json`.
+        max_tokens (int): Completion token cap per LLM request.
+        skip_minified (bool): Do not scan minified bundles (`*.min.*`,
+            `*.bundle.*`, or very long lines at the top of the file).
 
     Raises:
         RuntimeError: On scanning or extraction failure.
@@ -71,38 +138,60 @@ def run_static_audit(
 
     logger.info("Static audit started (dir=%s)", path)
 
-    # Collect source files
-    files = list(iter_source_files(path, include, exclude))
-    if not files:
+    # Source files stream from the walk into scanning; only enough paths to
+    # pick a strategy are buffered up front
+    paths = map(str, iter_source_files(path, include, exclude))
+    head = list(islice(paths, _PARALLEL_MIN_FILES))
+    if not head:
         raise RuntimeError("No source files found – aborting.")
-    logger.info("Collected %d source files", len(files))
 
-    # Extract endpoints using regex
+    # Extract endpoints using regex and index symbols, reading each file once
     findings: List[Finding] = []
-    for fp in files:
-        try:
-            findings.extend(
-                extract_endpoints(fp.read_text(encoding="utf-8", errors="ignore"), str(fp))
-            )
-        except Exception as exc:
-            logger.error("Failed reading %s: %s", fp, exc)
-
-    # Deduplicate findings
-    findings = deduplicate_findings(findings)
+    index = SymbolIndex()
+    n_files = n_skipped = 0
+    scan = partial(_scan_file, skip_minified=skip_minified)
+    with ExitStack() as stack:
+        if len(head) < _PARALLEL_MIN_FILES:
+            results = map(scan, head)  # the walk is already exhausted
+        else:
+            # Regex scanning is CPU-bound; fan out across cores to sidestep the
+            # GIL. Workers start on the first chunks while the walk continues.
+            ex = stack.enter_context(ProcessPoolExecutor())
+            results = ex.map(scan, chain(head, paths), chunksize=_SCAN_CHUNKSIZE)
+        for n_files, result in enumerate(results, 1):
+            if result is None:
+                n_skipped += 1
+                continue
+            file_findings, refs = result
+            findings.extend(file_findings)
+            index.add(refs)
+    index.finalize()
+    logger.info("Scanned %d source files", n_files - n_skipped)
+    if n_skipped:
+        logger.info("Skipped %d minified files", n_skipped)
+
+    # Findings arrive already deduplicated per file
     if not findings:
         raise RuntimeError("No endpoints detected – nothing to audit.")
     logger.info("Extracted %d raw findings", len(findings))
 
-    # Build symbol index
-    index = SymbolIndex(files)
-    index.build()
-    logger.info("Symbol index built (%d symbols)", index.size)
-
-    # LLM enrichment (always enabled)
-    findings, trace = run_trace(findings, index, model_name=None)
-    Path(path, "audit_trace.json").write_text(
-        json.dumps(trace, ensure_ascii=False, indent=2)
-    )
+    # LLM enrichment (always enabled). Static assets are only tagged in the
+    # report, so they are not worth an LLM call.
+    enrichable = [f for f in findings if not is_static_resource(f.url)]
+    logger.info("Skipping enrichment of %d static-asset findings", len(findings) - len(enrichable))
+    trace: List[Dict[str, str]] = []
+    if enrichable:
+        # Findings are enriched in place, so `findings` keeps its order
+        _, trace = run_trace(
+            enrichable,
+            index,
+            model_name=None,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            cache_path=Path(path, CACHE_FILENAME) if cache else None,
+            max_tokens=max_tokens,
+        )
+    write_json(Path(path, "audit_trace.json"), trace)
     logger.info("LLM enrichment complete")
 
     # Write report
@@ -132,6 +221,34 @@ def _parse_args() -> argparse.Namespace:
         default="node_modules,dist,build,.git",
         help="Comma-separated directory names to exclude",
     )
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of findings enriched per LLM agent call",
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of concurrent LLM requests",
+    )
+    p.add_argument(
+        "--max-tokens",
+        type=int,
+        default=DEFAULT_MAX_TOKENS,
+        help="Completion token cap per LLM request",
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the enrichment cache ({CACHE_FILENAME})",
+    )
+    p.add_argument(
+        "--skip-minified",
+        action="store_true",
+        help="Skip minified bundles (*.min.*, *.bundle.*, very long lines)",
+    )
     return p.parse_args()
 
 
@@ -148,6 +265,11 @@ def main() -> None:
         path=args.path,
         include=args.include.split(","),
         exclude=args.exclude.split(","),
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        cache=not args.no_cache,
+        max_tokens=args.max_tokens,
+        skip_minified=args.skip_minified,
     )
 
 
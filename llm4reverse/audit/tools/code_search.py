@@ -7,6 +7,7 @@ Audit Module - Tools
 LangChain tool to perform naive text search over code snippets using a prebuilt SymbolIndex.
 """
 
+import json
 import logging
 from typing import List
 from langchain_core.tools import Tool
@@ -15,6 +16,25 @@ from llm4reverse.audit.resolvers.symbol_index import SymbolRef, SymbolIndex
 logger = logging.getLogger(__name__)
 
 
+def _format_matches(query: str, refs: List[SymbolRef]) -> str:
+    """
+    Render the matches of one query as Markdown.
+
+    Args:
+        query (str): Substring that was searched.
+        refs (List[SymbolRef]): Its matches.
+
+    Returns:
+        str: Markdown list of matches or a not-found message.
+    """
+    if not refs:
+        return f"No matches for `{query}`"
+    lines = [f"Matches for `{query}`:"]
+    for r in refs:
+        lines.append(f"- {r.file}:{r.line}\n```js\n{r.snippet}\n```")
+    return "\n".join(lines)
+
+
 def _make_code_search_tool(index: SymbolIndex) -> Tool:
     """
     Create a LangChain Tool that searches code snippets by substring.
@@ -40,16 +60,8 @@ def _make_code_search_tool(index: SymbolIndex) -> Tool:
             logger.debug("CodeSearchTool received query: %s", query)
 
             refs: List[SymbolRef] = index.search(query)
-            if not refs:
-                return f"No matches for `{query}`"
-
-            lines = [f"Matches for `{query}`:"]
-            for r in refs:
-                lines.append(f"- {r.file}:{r.line}\n```js\n{r.snippet}\n```")
-
-            result = "\n".join(lines)
             logger.debug("Code search returned %d matches", len(refs))
-            return result
+            return _format_matches(query, refs)
         except Exception:
             logger.exception("CodeSearchTool failed for %s", query)
             return "ERROR: code search failed"
@@ -61,6 +73,55 @@ def _make_code_search_tool(index: SymbolIndex) -> Tool:
     )
 
 
+def _make_code_search_many_tool(index: SymbolIndex) -> Tool:
+    """
+    Create a LangChain Tool that runs several substring searches in one call.
+
+    Queries arrive as a JSON array of strings, so any substring – including
+    JavaScript such as `a || b` – can be searched without escaping rules.
+
+    Args:
+        index (SymbolIndex): Prebuilt symbol index.
+
+    Returns:
+        Tool: LangChain Tool instance.
+    """
+    def _search_many(queries_json: str) -> str:
+        """
+        Perform several substring searches across code snippets.
+
+        Args:
+            queries_json (str): JSON array of substrings, e.g. `["apiKey", "a || b"]`.
+
+        Returns:
+            str: Markdown list of matches or a not-found message per substring.
+        """
+        try:
+            logger.debug("CodeSearchManyTool received queries: %s", queries_json)
+            try:
+                queries = json.loads(queries_json)
+            except ValueError:
+                queries = None
+            if not isinstance(queries, list) or not all(isinstance(q, str) for q in queries):
+                return 'ERROR: expected a JSON array of strings, e.g. ["apiKey", "baseURL"]'
+
+            queries = [q.strip() for q in queries if q.strip()]
+            sections = [_format_matches(q, refs) for q, refs in index.search_many(queries).items()]
+            return "\n\n".join(sections) or "No queries given"
+        except Exception:
+            logger.exception("CodeSearchManyTool failed for %s", queries_json)
+            return "ERROR: code search failed"
+
+    return Tool(
+        name="code_search_many",
+        description=(
+            "Like code_search for several substrings at once. Input is a JSON array "
+            'of strings (e.g. ["apiKey", "baseURL"]); returns matches per substring.'
+        ),
+        func=_search_many,
+    )
+
+
 # Backward compatibility: keep class name for imports
 class CodeSearchTool:
     """
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+utils.py
+Audit Module
+=====================
+
+Small helpers shared by the static audit extractors and resolvers.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Union
+
+_NEWLINE_RE = re.compile(r"\n")
+_NEWLINE_BRE = re.compile(rb"\n")
+
+_STATIC_EXTS: Sequence[str] = (
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".css", ".svg", ".woff", ".ttf", ".webp",
+)
+
+# Minified-bundle heuristic: build-artefact file names, or a line longer than
+# `_MINIFIED_LINE_BYTES` within the first `_MINIFIED_HEAD_BYTES` of the file
+_MINIFIED_NAME_MARKERS: Sequence[str] = (".min.", ".bundle.")
+_MINIFIED_HEAD_BYTES = 4096
+_MINIFIED_LINE_BYTES = 2000
+
+
+def is_static_resource(url: Optional[str]) -> bool:
+    """
+    Check whether the given URL likely points to a static resource.
+
+    Args:
+        url (Optional[str]): The endpoint URL.
+
+    Returns:
+        bool: True if the URL is a static asset, False otherwise.
+    """
+    # 处理 None 或空字符串的情况
+    if not url:
+        return False
+    return url.lower().endswith(_STATIC_EXTS)
+
+
+def looks_minified(name: str, data: Union[bytes, mmap.mmap]) -> bool:
+    """
+    Guess whether a source file is a minified or bundled build artefact.
+
+    Only the file name and the first few KiB are inspected, so the check costs
+    the same for any file size.
+
+    Args:
+        name (str): File name (without directory).
+        data (Union[bytes, mmap.mmap]): File content (or a map of it).
+
+    Returns:
+        bool: True if the file looks minified.
+    """
+    if any(marker in name for marker in _MINIFIED_NAME_MARKERS):
+        return True
+    head = data[:_MINIFIED_HEAD_BYTES]
+    return any(len(line) > _MINIFIED_LINE_BYTES for line in head.split(b"\n"))
+
+
+class LineIndex:
+    """
+    Map character offsets in a text to 1-based line numbers.
+
+    Newline offsets are collected once, on the first lookup, so texts without
+    any match never pay for the scan; each lookup is then a binary search
+    instead of a `text.count("\\n", 0, pos)` rescan from the start.
+    """
+
+    def __init__(self, text: Union[str, bytes, mmap.mmap]) -> None:
+        """
+        Args:
+            text (Union[str, bytes, mmap.mmap]): Text (or raw buffer, e.g. an
+                mmap) whose offsets will be resolved.
+        """
+        self._text = text
+        self._newlines: Optional[List[int]] = None
+
+    def line_of(self, pos: int) -> int:
+        """
+        Return the line number containing `pos`.
+
+        Args:
+            pos (int): Character (or byte) offset into the text.
+
+        Returns:
+            int: 1-based line number (same as `text.count("\\n", 0, pos) + 1`).
+        """
+        if self._newlines is None:
+            # A plain list from `finditer` is the fastest option measured: a
+            # `str.find` loop takes ~2x as long to build, and an `array` –
+            # though 4x smaller – is slower to fill and to bisect (boxing).
+            # The index only lives for one file, so speed wins.
+            rx = _NEWLINE_RE if isinstance(self._text, str) else _NEWLINE_BRE
+            self._newlines = [m.start() for m in rx.finditer(self._text)]
+        return bisect_left(self._newlines, pos) + 1
@@ -14,6 +14,7 @@ import logging
 import sys
 import time
 from pathlib import Path
+from typing import List, Optional
 
 # Allow running as a script: `python llm4reverse/cli.py ...`
 # When executed directly, Python's sys.path lacks the project root,
@@ -23,16 +24,25 @@ if __package__ in (None, "") and str(Path(__file__).resolve().parents[1]) not in
 
 from importlib.metadata import PackageNotFoundError, version
 
+from llm4reverse.audit.agents.defaults import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_TOKENS,
+)
+
 try:
     from llm4reverse import __version__
 except ImportError:
     __version__ = None
 
-from llm4reverse.reverse.pipeline import run_dynamic_reverse
-from llm4reverse.audit.pipeline import run_static_audit
+# Workflow modules (langchain, playwright, openai, ...) are imported inside
+# the handlers so that `--help` and `--version` start fast.
 
 logger = logging.getLogger(__name__)
 
+# Parser built by the first `build_parser()` call, reused afterwards
+_PARSER: Optional[argparse.ArgumentParser] = None
+
 
 def configure_logging(verbose: bool) -> None:
     """
@@ -53,6 +63,22 @@ def build_parser() -> argparse.ArgumentParser:
     """
     Build the CLI parser with subcommands.
 
+    The parser is built once per process; repeated `main()` calls (e.g. from
+    tests or scripts) reuse it.
+
+    Returns:
+        argparse.ArgumentParser: Configured parser.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Construct the CLI parser; see `build_parser`.
+
     Returns:
         argparse.ArgumentParser: Configured parser.
     """
@@ -77,10 +103,20 @@ def build_parser() -> argparse.ArgumentParser:
 
     # reverse subcommand
     p_rev = subparsers.add_parser("reverse", help="Run dynamic web reverse workflow")
-    p_rev.add_argument("--url", required=True, help="Target page URL to reverse")
+    rev_target = p_rev.add_mutually_exclusive_group(required=True)
+    rev_target.add_argument("--url", help="Target page URL to reverse")
+    rev_target.add_argument(
+        "--urls-file",
+        help="File with one URL per line; all are reversed with a single browser launch",
+    )
     p_rev.add_argument("--output", "--outdir", default="./reverse_out", help="Output directory")
     p_rev.add_argument("--no-headless", action="store_true", help="Run browser in UI mode")
     p_rev.add_argument("--timeout", type=int, default=30, help="Extra wait after networkidle (seconds)")
+    p_rev.add_argument(
+        "--block-assets",
+        action="store_true",
+        help="Do not load images, media, fonts and stylesheets (faster, smaller HAR)",
+    )
     p_rev.set_defaults(func=handle_reverse)
 
     # audit subcommand
@@ -96,6 +132,34 @@ def build_parser() -> argparse.ArgumentParser:
         default="node_modules,dist,build,.git",
         help="Comma-separated directory names to exclude",
     )
+    p_aud.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of findings enriched per LLM agent call",
+    )
+    p_aud.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of concurrent LLM requests",
+    )
+    p_aud.add_argument(
+        "--max-tokens",
+        type=int,
+        default=DEFAULT_MAX_TOKENS,
+        help="Completion token cap per LLM request",
+    )
+    p_aud.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the enrichment cache (.llm4reverse_cache.json)",
+    )
+    p_aud.add_argument(
+        "--skip-minified",
+        action="store_true",
+        help="Skip minified bundles (*.min.*, *.bundle.*, very long lines)",
+    )
     p_aud.set_defaults(func=handle_audit)
 
     return parser
@@ -106,11 +170,15 @@ def handle_reverse(args: argparse.Namespace) -> int:
     Handle the 'reverse' subcommand.
 
     Args:
-        args (argparse.Namespace): Parsed args with url, jsfile, model.
+        args (argparse.Namespace): Parsed args with url or urls_file, output, no_headless, timeout,
+            block_assets.
 
     Returns:
         int: Exit code.
     """
+    from llm4reverse.reverse.collectors.browser import ASSET_RESOURCE_TYPES
+    from llm4reverse.reverse.pipeline import run_dynamic_reverse, run_dynamic_reverse_many
+
     configure_logging(args.verbose)
     start = time.time()
     try:
@@ -118,7 +186,20 @@ def handle_reverse(args: argparse.Namespace) -> int:
         out_dir = getattr(args, "output", "./reverse_out")
         headless = not getattr(args, "no_headless", False)
         timeout = getattr(args, "timeout", 30)
-        run_dynamic_reverse(url=args.url, out_dir=out_dir, headless=headless, timeout=timeout)
+        block = ASSET_RESOURCE_TYPES if getattr(args, "block_assets", False) else None
+        if args.urls_file:
+            urls = _read_urls(args.urls_file)
+            if not urls:
+                logger.error("No URLs found in %s", args.urls_file)
+                return 1
+            failed = run_dynamic_reverse_many(
+                urls, out_dir=out_dir, headless=headless, timeout=timeout, block_resources=block
+            )
+            logger.info("Reverse workflow completed in %.2f seconds", time.time() - start)
+            return 1 if failed else 0
+        run_dynamic_reverse(
+            url=args.url, out_dir=out_dir, headless=headless, timeout=timeout, block_resources=block
+        )
         logger.info("Reverse workflow completed in %.2f seconds", time.time() - start)
         return 0
     except Exception:
@@ -126,16 +207,33 @@ def handle_reverse(args: argparse.Namespace) -> int:
         return 1
 
 
+def _read_urls(path: str) -> List[str]:
+    """
+    Read target URLs from a text file.
+
+    Args:
+        path (str): File with one URL per line; blank lines and `#` comments are skipped.
+
+    Returns:
+        List[str]: URLs in file order.
+    """
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [ln.strip() for ln in lines if ln.strip() and not ln.lstrip().startswith("#")]
+
+
 def handle_audit(args: argparse.Namespace) -> int:
     """
     Handle the 'audit' subcommand.
 
     Args:
-        args (argparse.Namespace): Parsed args with path, include, exclude.
+        args (argparse.Namespace): Parsed args with path, include, exclude, batch_size, concurrency, max_tokens, no_cache,
+            skip_minified.
 
     Returns:
         int: Exit code.
     """
+    from llm4reverse.audit.pipeline import run_static_audit
+
     configure_logging(args.verbose)
     start = time.time()
     try:
@@ -143,6 +241,11 @@ def handle_audit(args: argparse.Namespace) -> int:
             path=args.path,
             include=args.include.split(","),
             exclude=args.exclude.split(","),
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            cache=not args.no_cache,
+            max_tokens=args.max_tokens,
+            skip_minified=args.skip_minified,
         )
         logger.info("Audit workflow completed in %.2f seconds", time.time() - start)
         return 0
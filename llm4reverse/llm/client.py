@@ -7,16 +7,22 @@ LLM Module
 OpenAI client wrapper for Chat calls.
 """
 
+import json
 import logging
 import os
+from functools import cache, lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
-# Load .env variables at import time
-load_dotenv()
+
+@cache
+def _load_env() -> None:
+    """Load .env variables once, on the first client request."""
+    load_dotenv()
+
 
 # Monkey-patch to fix custom API gateway response format compatibility
 def _patch_langchain_openai():
@@ -27,9 +33,14 @@ def _patch_langchain_openai():
     The issue occurs in _create_chat_result where it expects:
     `response if isinstance(response, dict) else response.model_dump()`
     but custom APIs may return a string instead of an object.
+
+    Idempotent: a sentinel on the class keeps repeated imports (e.g. via a
+    different `sys.path` entry) from wrapping the method again.
     """
     try:
         from langchain_openai.chat_models.base import ChatOpenAI as BaseChatOpenAI
+        if getattr(BaseChatOpenAI, "_l4r_patched", False):
+            return
         original_create_chat_result = BaseChatOpenAI._create_chat_result
         
         def patched_create_chat_result(self, response, generation_info=None):
@@ -37,7 +48,6 @@ def _patch_langchain_openai():
             # Check if response is a string (custom API gateway issue)
             if isinstance(response, str):
                 logger.warning("Custom API gateway returned string response, attempting to parse...")
-                import json
                 try:
                     # Try to parse as JSON
                     response_dict = json.loads(response)
@@ -72,6 +82,7 @@ def _patch_langchain_openai():
         
         # Apply the patch
         BaseChatOpenAI._create_chat_result = patched_create_chat_result
+        BaseChatOpenAI._l4r_patched = True
         logger.debug("Applied langchain_openai compatibility patch for custom API gateways")
     except Exception as e:
         logger.warning("Failed to apply langchain_openai patch: %s", e)
@@ -81,10 +92,20 @@ def _patch_langchain_openai():
 # Apply patch at module import time
 _patch_langchain_openai()
 
-def get_chat_llm(model_name: Optional[str] = None, temperature: float = 0.0) -> ChatOpenAI:
+def get_chat_llm(
+    model_name: Optional[str] = None,
+    temperature: float = 0.0,
+    prompt_cache_key: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> ChatOpenAI:
     """
     Create and return a ChatOpenAI instance with configured settings.
 
+    Clients are cached per configuration, so repeated calls share one instance
+    (and its HTTP connection pool) instead of rebuilding it. The async pool is
+    bound to the event loop it is first used on: run async calls on one
+    long-lived loop (as `run_trace` does), not a new `asyncio.run` each time.
+
     Environment Variables:
         API_KEY: API key for OpenAI-compatible provider.
         BASE_URL: (optional) Override API base URL.
@@ -93,10 +114,14 @@ def get_chat_llm(model_name: Optional[str] = None, temperature: float = 0.0) ->
     Args:
         model_name (str): OpenAI model name.
         temperature (float): Sampling temperature.
+        prompt_cache_key (Optional[str]): Stable key sent as `prompt_cache_key` so that
+            OpenAI routes requests sharing a static prompt prefix to the same cache.
+        max_tokens (Optional[int]): Completion token cap; None leaves the provider default.
 
     Returns:
         ChatOpenAI: Configured chat LLM client.
     """
+    _load_env()
     api_key = os.getenv("API_KEY")
     base_url = os.getenv("BASE_URL", None)
     if not api_key:
@@ -107,7 +132,32 @@ def get_chat_llm(model_name: Optional[str] = None, temperature: float = 0.0) ->
     if not model_name:
         logger.error("MODEL is not set and no model_name provided")
         raise RuntimeError("Missing MODEL")
-    
+    return _build_chat_llm(model_name, temperature, api_key, base_url, prompt_cache_key, max_tokens)
+
+
+@lru_cache(maxsize=8)
+def _build_chat_llm(
+    model_name: str,
+    temperature: float,
+    api_key: str,
+    base_url: Optional[str],
+    prompt_cache_key: Optional[str],
+    max_tokens: Optional[int],
+) -> ChatOpenAI:
+    """
+    Construct a ChatOpenAI client; memoized on the fully resolved settings.
+
+    Args:
+        model_name (str): OpenAI model name.
+        temperature (float): Sampling temperature.
+        api_key (str): API key.
+        base_url (Optional[str]): Custom API base URL, if any.
+        prompt_cache_key (Optional[str]): See `get_chat_llm`.
+        max_tokens (Optional[int]): See `get_chat_llm`.
+
+    Returns:
+        ChatOpenAI: Configured chat LLM client.
+    """
     # Build kwargs for ChatOpenAI
     kwargs = {
         "model": model_name,
@@ -115,6 +165,8 @@ def get_chat_llm(model_name: Optional[str] = None, temperature: float = 0.0) ->
         "api_key": api_key,
         "streaming": False,  # Disable streaming for agent compatibility
     }
+    if max_tokens:
+        kwargs["max_tokens"] = max_tokens
     
     # Only add base_url if it's provided (some custom APIs may have compatibility issues)
     if base_url:
@@ -123,6 +175,9 @@ def get_chat_llm(model_name: Optional[str] = None, temperature: float = 0.0) ->
         # Add timeout and other settings that might help
         kwargs["timeout"] = 60.0
         logger.info("Using custom base_url: %s", base_url)
+    elif prompt_cache_key:
+        # Only sent to the official endpoint; gateways may reject unknown body fields
+        kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
     
     # Instantiate LangChain ChatOpenAI (0.3.x style kwargs)
     try:
@@ -9,9 +9,70 @@ Centralizes how outputs are written to disk so that CLI remains concise.
 
 from __future__ import annotations
 
+import dataclasses
+import io
 import json
+import tarfile
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize `obj` as pretty-printed UTF-8 JSON.
+
+    Serialized with orjson, which emits bytes directly and is several times
+    faster than `json.dumps` on large reports. For ordinary data the output
+    matches `json.dumps(obj, ensure_ascii=False, indent=2)`, except that
+    NaN and infinities are written as `null` (`json` writes `NaN`).
+
+    orjson rejects integers wider than 64 bits and strings with lone
+    surrogates, both of which LLM-supplied values may contain; such objects
+    are written with `json.dumps` instead (lone surrogates become `?`).
+
+    Args:
+        obj (Any): JSON-serializable object (dataclasses are supported too).
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default)
+        return text.encode("utf-8", errors="replace")
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert dataclasses for the `json.dumps` fallback of `dumps_json`.
+
+    Args:
+        obj (Any): Object `json` cannot serialize natively.
+
+    Returns:
+        Any: A dict of the dataclass fields.
+
+    Raises:
+        TypeError: If `obj` is not a dataclass instance.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """
+    Write `obj` as pretty-printed UTF-8 JSON (see `dumps_json`).
+
+    Args:
+        path (Path): Destination file.
+        obj (Any): JSON-serializable object (dataclasses are supported too).
+    """
+    path.write_bytes(dumps_json(obj))
 
 
 def save_artifacts(
@@ -20,6 +81,7 @@ def save_artifacts(
     js_report: Optional[Dict[str, Any]],
     ast_report: Optional[Dict[str, Any]],
     reverse_md: Optional[str],
+    monolithic: bool = False,
 ) -> None:
     """
     Save all generated artifacts to the specified directory.
@@ -30,22 +92,41 @@ def save_artifacts(
         js_report (Optional[Dict[str, Any]]): JavaScript beautification report.
         ast_report (Optional[Dict[str, Any]]): AST analysis report.
         reverse_md (Optional[str]): Reverse engineering Markdown report.
+        monolithic (bool): Write one `artifacts.tar` holding the same files
+            instead of one file each – a single create/write/close on
+            filesystems where per-file overhead dominates (NFS, overlays).
     """
     # Create output directory if it doesn't exist
     outdir.mkdir(parents=True, exist_ok=True)
 
-    # Save captured data
+    # Serialize every artifact up front: (file name, payload)
+    payloads: List[Tuple[str, bytes]] = []
+
+    # Captured data
     if capture is not None:
-        (outdir / "capture.json").write_text(json.dumps(capture, ensure_ascii=False, indent=2), encoding="utf-8")
+        payloads.append(("capture.json", dumps_json(capture)))
 
-    # Save JavaScript beautification report
+    # JavaScript beautification report
     if js_report is not None:
-        (outdir / "js_beautify.json").write_text(json.dumps(js_report, ensure_ascii=False, indent=2), encoding="utf-8")
+        payloads.append(("js_beautify.json", dumps_json(js_report)))
 
-    # Save AST analysis report
+    # AST analysis report
     if ast_report is not None:
-        (outdir / "js_ast.json").write_text(json.dumps(ast_report, ensure_ascii=False, indent=2), encoding="utf-8")
+        payloads.append(("js_ast.json", dumps_json(ast_report)))
 
-    # Save Markdown report
+    # Markdown report
     if reverse_md:
-        (outdir / "reverse_report.md").write_text(reverse_md, encoding="utf-8")
+        payloads.append(("reverse_report.md", reverse_md.encode("utf-8")))
+
+    if not monolithic:
+        for name, data in payloads:
+            (outdir / name).write_bytes(data)
+        return
+
+    mtime = time.time()
+    with tarfile.open(outdir / "artifacts.tar", "w") as tar:
+        for name, data in payloads:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(data))
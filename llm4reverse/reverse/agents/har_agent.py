@@ -13,8 +13,10 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import Dict, List, Tuple, Optional, Any
+from itertools import islice
+from typing import Dict, List, Set, Tuple, Optional, Any
 
+import orjson
 from langchain_core.prompts import PromptTemplate
 from langchain_core.tools import Tool
 from langchain_core.callbacks import BaseCallbackHandler
@@ -27,29 +29,155 @@ from langchain.agents import create_react_agent, AgentExecutor
 
 logger = logging.getLogger(__name__)
 
+# JSON arrays embedded in agent output, bare or in a fenced code block
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*?\]", re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\[[\s\S]*?\])\s*```", re.DOTALL)
+
+# URLs the fallback extractor skips: static assets, and inline/blob sources
+_STATIC_EXTS = (
+    ".js", ".css", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".woff", ".woff2", ".ttf", ".eot",
+)
+_SKIP_SCHEMES = ("data:", "blob:")
+
+# HAR fields read by the search tool and the fallback extractor
+_REQUEST_FIELDS = ("url", "method", "headers", "queryString")
+_RESPONSE_FIELDS = ("status", "headers")
+
+# HarSearch shows the agent this many headers per request / response, with
+# values cut to this many characters
+_TOOL_HEADERS = 3
+_TOOL_HEADER_VALUE_MAX = 80
+
+# ReAct prompt, parsed once at import and shared by every run
+REACT_PROMPT = PromptTemplate.from_template(
+    """You are analysing a HAR dump.
+You may call tools to gather additional information.
+
+Available tools:
+{tools}
+
+Tool names:
+{tool_names}
+
+Use the following format:
+Thought: describe your thought
+Action: one of [{tool_names}]
+Action Input: the input for the action
+Observation: the result of the action
+… (repeat N times)
+Thought: I now know the final answer
+
+Return ONLY a JSON array where each element has keys:
+`url`, `method`, `headers`, `params`, `body`, `auth`.
+
+Question: {input}
+{agent_scratchpad}"""
+)
+
+
+def project_har(har_dict: Dict) -> Dict:
+    """
+    Reduce a HAR to the fields this module reads.
+
+    Response bodies, timings, cookies, cache data etc. usually make up most of
+    a HAR; dropping them right after parsing lets the full document be freed
+    before the (long) LLM stage. Present keys keep their values and absent ones
+    stay absent, so analysis results are unchanged.
+
+    Args:
+        har_dict (Dict): Parsed HAR content.
+
+    Returns:
+        Dict: `{"log": {"entries": [...]}}` with only request url / method /
+            headers / queryString / postData.text and response status / headers.
+    """
+    if not isinstance(har_dict, dict) or not isinstance(har_dict.get("log"), dict):
+        return har_dict
+    return {"log": {"entries": [project_har_entry(e) for e in har_dict["log"].get("entries", [])]}}
+
+
+def project_har_entry(entry: Any) -> Any:
+    """
+    Reduce one HAR entry to the fields this module reads (see `project_har`).
+
+    Usable on entries streamed one at a time, without the whole HAR in memory.
+
+    Args:
+        entry (Any): One element of `log.entries`.
+
+    Returns:
+        Any: Projected entry (non-dict values are returned unchanged).
+    """
+    if not isinstance(entry, dict):
+        return entry
+    slim: Dict[str, Any] = {}
+    if "request" in entry:
+        req = entry["request"]
+        slim["request"] = {k: req[k] for k in _REQUEST_FIELDS if k in req}
+        post_data = req.get("postData")
+        if post_data is not None:
+            slim["request"]["postData"] = {k: post_data[k] for k in ("text",) if k in post_data}
+    if "response" in entry:
+        res = entry["response"]
+        slim["response"] = {k: res[k] for k in _RESPONSE_FIELDS if k in res}
+    return slim
+
+
+def _slim_headers(headers: List[Dict]) -> List[Dict]:
+    """
+    Keep the first `_TOOL_HEADERS` headers, with long values truncated.
+
+    Args:
+        headers (List[Dict]): HAR header objects (`{"name": ..., "value": ...}`).
+
+    Returns:
+        List[Dict]: Headers as shown to the agent; a truncated value ends with
+            `…[+N]`, N being the number of characters dropped.
+    """
+    slim = []
+    for header in headers[:_TOOL_HEADERS]:
+        value = header.get("value")
+        if isinstance(value, str) and len(value) > _TOOL_HEADER_VALUE_MAX:
+            dropped = len(value) - _TOOL_HEADER_VALUE_MAX
+            header = {**header, "value": f"{value[:_TOOL_HEADER_VALUE_MAX]}…[+{dropped}]"}
+        slim.append(header)
+    return slim
+
 
 def _make_har_search_tool(har_dict: Dict) -> Tool:
     """
     Create a LangChain Tool that searches HAR entries by substring.
+
+    The tool shows a slim view of each entry (first headers only, long values
+    such as JWTs or CSP policies truncated), which keeps agent context small;
+    `har_dict` itself is left intact for the fallback extractor.
     """
     entries = har_dict["log"]["entries"]
+    # Lowercased once: the agent searches the same entries on every step
+    urls_lower = [e.get("request", {}).get("url", "").lower() for e in entries]
+    # Slim views, built the first time an entry is returned
+    views: Dict[int, Dict] = {}
+
+    def _view(i: int) -> Dict:
+        view = views.get(i)
+        if view is None:
+            request, response = entries[i].get("request", {}), entries[i].get("response", {})
+            view = views[i] = {
+                "url": request.get("url"),
+                "method": request.get("method"),
+                "status": response.get("status"),
+                "req_headers": _slim_headers(request.get("headers", [])),
+                "res_headers": _slim_headers(response.get("headers", [])),
+            }
+        return view
 
     def _search(query: str) -> str:
-        matches = []
-        for e in entries:
-            if query.lower() in e["request"]["url"].lower():
-                matches.append(
-                    {
-                        "url": e["request"]["url"],
-                        "method": e["request"]["method"],
-                        "status": e["response"]["status"],
-                        "req_headers": e["request"]["headers"][:3],
-                        "res_headers": e["response"]["headers"][:3],
-                    }
-                )
-            if len(matches) >= 10:
-                break
-        return json.dumps(matches, ensure_ascii=False)
+        query_lower = query.lower()
+        hits = (i for i, url in enumerate(urls_lower) if query_lower in url)
+        matches = [_view(i) for i in islice(hits, 10)]
+        # Canonical compact form: fewer tokens, and identical evidence always
+        # serializes to identical bytes (friendlier to provider prompt caching)
+        return orjson.dumps(matches, option=orjson.OPT_SORT_KEYS).decode("utf-8")
 
     return Tool(
         name="HarSearch",
@@ -131,6 +259,23 @@ class TraceCallback(BaseCallbackHandler):
         logger.info("Tool call completed (output length: %d)", len(output) if output else 0)
 
 
+def _loads_list(text: str) -> Optional[List[Any]]:
+    """
+    Parse `text` as JSON, returning it only if it is an array.
+
+    Args:
+        text (str): Candidate JSON text.
+
+    Returns:
+        Optional[List[Any]]: Parsed array, or None if invalid or not a list.
+    """
+    try:
+        parsed = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, list) else None
+
+
 def _extract_json_from_text(text: str) -> Optional[List[Dict]]:
     """
     Extract JSON array from text.
@@ -148,39 +293,26 @@ def _extract_json_from_text(text: str) -> Optional[List[Dict]]:
         return None
     
     # First attempt to parse the entire text directly
-    try:
-        parsed = json.loads(text.strip())
-        if isinstance(parsed, list):
+    parsed = _loads_list(text.strip())
+    if parsed is not None:
+        return parsed
+
+    # Then the span from the first "[" to the last "]": handles prose around
+    # the answer and nested arrays without any regex backtracking
+    i, j = text.find("["), text.rfind("]")
+    if 0 <= i < j:
+        parsed = _loads_list(text[i:j + 1])
+        if parsed is not None:
+            logger.debug("Successfully extracted JSON array from text")
             return parsed
-    except json.JSONDecodeError:
-        pass
-    
-    # Try to find JSON array using regex
-    # Match content from [ to ]
-    json_pattern = r'\[[\s\S]*?\]'
-    matches = re.findall(json_pattern, text, re.MULTILINE | re.DOTALL)
-    
-    for match in matches:
-        try:
-            parsed = json.loads(match)
-            if isinstance(parsed, list):
+
+    # Try to find JSON in code blocks, then any bracketed span
+    for rx in (_CODE_BLOCK_RE, _JSON_ARRAY_RE):
+        for match in rx.findall(text):
+            parsed = _loads_list(match)
+            if parsed is not None:
                 logger.debug("Successfully extracted JSON array from text")
                 return parsed
-        except json.JSONDecodeError:
-            continue
-    
-    # Try to find JSON in code blocks
-    code_block_pattern = r'```(?:json)?\s*(\[[\s\S]*?\])\s*```'
-    matches = re.findall(code_block_pattern, text, re.MULTILINE | re.DOTALL)
-    
-    for match in matches:
-        try:
-            parsed = json.loads(match)
-            if isinstance(parsed, list):
-                logger.debug("Successfully extracted JSON array from code block")
-                return parsed
-        except json.JSONDecodeError:
-            continue
     
     logger.warning("Failed to extract JSON array from text: %s", text[:200])
     return None
@@ -213,37 +345,11 @@ def run_har_agent(har_dict: Dict) -> Tuple[List[Dict], List[Dict]]:
     num_entries = len(har_dict.get("log", {}).get("entries", []))
     logger.info("HAR contains %d entries", num_entries)
 
-    # Build ReAct prompt using PromptTemplate
-    react_prompt = PromptTemplate.from_template(
-        """You are analysing a HAR dump.
-You may call tools to gather additional information.
-
-Available tools:
-{tools}
-
-Tool names:
-{tool_names}
-
-Use the following format:
-Thought: describe your thought
-Action: one of [{tool_names}]
-Action Input: the input for the action
-Observation: the result of the action
-… (repeat N times)
-Thought: I now know the final answer
-
-Return ONLY a JSON array where each element has keys:
-`url`, `method`, `headers`, `params`, `body`, `auth`.
-
-Question: {input}
-{agent_scratchpad}"""
-    )
-
     # Use LangChain 0.3.x create_react_agent and AgentExecutor
     logger.info("Creating ReAct agent using LangChain 0.3.x")
     try:
         # Create agent with custom prompt
-        agent = create_react_agent(llm=llm, tools=tools, prompt=react_prompt)
+        agent = create_react_agent(llm=llm, tools=tools, prompt=REACT_PROMPT)
     except Exception as prompt_err:
         # If custom prompt fails, use default prompt
         logger.warning("create_react_agent with custom prompt failed: %s, using default prompt", prompt_err)
@@ -328,15 +434,23 @@ def _extract_endpoints_from_har(har_dict: Dict) -> List[Dict]:
     
     logger.info("Processing %d HAR entries...", total_entries)
     
-    # For deduplication
-    seen_urls = set()
+    # For deduplication: (method, url) tuples reuse the entry's strings (and
+    # their cached hashes) instead of building a new key string per entry
+    seen_urls: Set[Tuple[str, str]] = set()
     
-    # Output progress every 100 entries or 10% of total
+    # Output progress every 100 entries or 10% of total. The indices are
+    # computed once (none if INFO is disabled), so each entry only pays a
+    # set lookup.
     progress_interval = max(100, total_entries // 10)
+    milestones: Set[int] = (
+        {0, *range(progress_interval - 1, total_entries, progress_interval)}
+        if logger.isEnabledFor(logging.INFO)
+        else set()
+    )
     
     for idx, entry in enumerate(entries):
         # Output progress
-        if (idx + 1) % progress_interval == 0 or idx == 0:
+        if idx in milestones:
             logger.info("Processing entry %d/%d (%.1f%%)...", idx + 1, total_entries, (idx + 1) * 100.0 / total_entries)
         
         try:
@@ -347,15 +461,15 @@ def _extract_endpoints_from_har(har_dict: Dict) -> List[Dict]:
             method = request.get("method", "GET")
             
             # Skip static resources
-            if any(url.endswith(ext) for ext in [".js", ".css", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".woff", ".woff2", ".ttf", ".eot"]):
+            if url.endswith(_STATIC_EXTS):
                 continue
             
             # Skip data: and blob: URLs
-            if url.startswith(("data:", "blob:")):
+            if url.startswith(_SKIP_SCHEMES):
                 continue
             
             # Create unique key (URL + Method)
-            key = f"{method}:{url}"
+            key = (method, url)
             if key in seen_urls:
                 continue
             seen_urls.add(key)
@@ -9,6 +9,8 @@ AST extraction via Node + esprima.
 - No bundled esprima to keep package light.
 - Users can `npm i -g esprima` or install locally.
 - We embed a small Node script as a string and run it with the user's Node.
+- One Node process is started on first use and kept for later calls, so
+  Node startup and esprima warm-up are paid once per Python process.
 
 Behavior:
 - If Node is missing => {"error": "..."}.
@@ -17,15 +19,20 @@ Behavior:
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
 import shutil
 import subprocess
 import tempfile
-from typing import Any, Dict, Optional
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+import orjson
 
 
 _NODE_SCRIPT = r"""
-const fs = require("fs");
 let esprima;
 try {
   esprima = require("esprima");
@@ -34,13 +41,26 @@ try {
   process.exit(2);
 }
 
-function walk(node, visit) {
-  if (!node || typeof node !== "object") return;
-  visit(node);
-  for (const k of Object.keys(node)) {
-    const c = node[k];
-    if (Array.isArray(c)) for (const x of c) walk(x, visit);
-    else walk(c, visit);
+// Pre-order walk on an explicit stack: no recursion limit on deeply nested
+// bundles. Children are pushed in reverse so nodes are still visited in
+// source order; literals are leaves and are not descended into.
+function walk(root, visit) {
+  const stack = [root];
+  while (stack.length) {
+    const node = stack.pop();
+    visit(node);
+    if (node.type === "Literal") continue;
+    const keys = Object.keys(node);
+    for (let i = keys.length - 1; i >= 0; i--) {
+      const c = node[keys[i]];
+      if (Array.isArray(c)) {
+        for (let j = c.length - 1; j >= 0; j--) {
+          if (c[j] && typeof c[j] === "object") stack.push(c[j]);
+        }
+      } else if (c && typeof c === "object") {
+        stack.push(c);
+      }
+    }
   }
 }
 
@@ -82,28 +102,88 @@ function extract(ast) {
   };
 }
 
-function main() {
-  const file = process.argv[2];
-  if (!file) {
-    console.error("Usage: node <script> input.js");
-    process.exit(1);
-  }
-  const code = fs.readFileSync(file, "utf8");
+// Frames on stdin and stdout: 4-byte little-endian length + UTF-8 payload
+// (JavaScript source in, JSON result out), one reply per request.
+function reply(obj) {
+  const body = Buffer.from(JSON.stringify(obj), "utf8");
+  const head = Buffer.alloc(4);
+  head.writeUInt32LE(body.length, 0);
+  process.stdout.write(Buffer.concat([head, body]));
+}
+
+function handle(code) {
   let ast;
   try {
     ast = esprima.parseScript(code, { tolerant: true, loc: false, range: false });
   } catch (e) {
-    console.error("Parse error: " + String(e));
-    process.exit(3);
+    reply({ error: "Parse error: " + String(e) });
+    return;
+  }
+  let result;
+  try {
+    result = extract(ast);
+  } catch (e) {
+    // e.g. stack overflow on a very deep AST; keep the worker alive
+    result = { error: String(e) };
   }
-  const result = extract(ast);
-  process.stdout.write(JSON.stringify(result));
+  reply(result);
+}
+
+function main() {
+  let buf = Buffer.alloc(0);
+  process.stdin.on("data", (chunk) => {
+    buf = buf.length ? Buffer.concat([buf, chunk]) : chunk;
+    while (buf.length >= 4) {
+      const n = buf.readUInt32LE(0);
+      if (buf.length < 4 + n) break;
+      handle(buf.toString("utf8", 4, 4 + n));
+      buf = buf.subarray(4 + n);
+    }
+  });
 }
 
 main();
 """
 
 
+# Longest a single parse may take before the worker is killed and restarted
+EXTRACT_TIMEOUT = 60.0
+
+# Bytes of the worker's stderr reported when it fails
+_STDERR_TAIL = 8192
+
+# Stable location of the tool script, reused across workers and runs
+_TOOL_PATH = Path(tempfile.gettempdir()) / "llm4reverse_esprima_tool.js"
+
+
+def _tool_script() -> str:
+    """
+    Return the path of a file holding the current `_NODE_SCRIPT`.
+
+    `_TOOL_PATH` is reused when it already holds this script and belongs to
+    the current user; otherwise it is rewritten (atomically, so concurrent
+    runs never see a partial file). If it cannot be replaced, e.g. another
+    user's file in a shared temp dir, a private temporary file is used.
+
+    Returns:
+        str: Path of the script file.
+    """
+    try:
+        owned = not hasattr(os, "getuid") or _TOOL_PATH.stat().st_uid == os.getuid()
+        if owned and _TOOL_PATH.read_text(encoding="utf-8") == _NODE_SCRIPT:
+            return str(_TOOL_PATH)
+    except (OSError, UnicodeDecodeError):
+        pass  # missing or unreadable; write it below
+    fd, tmp = tempfile.mkstemp(suffix=".js", dir=_TOOL_PATH.parent)
+    with os.fdopen(fd, "w", encoding="utf-8") as tool_f:
+        tool_f.write(_NODE_SCRIPT)
+    try:
+        os.replace(tmp, _TOOL_PATH)
+    except OSError:
+        return tmp
+    return str(_TOOL_PATH)
+
+
 def _node_bin() -> Optional[str]:
     """
     Return path to node executable if present in PATH.
@@ -114,6 +194,157 @@ def _node_bin() -> Optional[str]:
     return shutil.which("node")
 
 
+class EsprimaWorker:
+    """
+    Long-lived `node` process running `_NODE_SCRIPT`.
+
+    Sources are sent over stdin and results read back from stdout, framed as
+    a 4-byte little-endian length followed by the UTF-8 payload. The process
+    is started on the first `extract` and restarted if it has died or was
+    killed for exceeding `timeout`. Its stderr goes to a temporary file (a
+    pipe nobody reads could fill up and block it) and is only read on failure.
+    """
+
+    def __init__(self, node: str, timeout: float = EXTRACT_TIMEOUT) -> None:
+        """
+        Args:
+            node (str): Path to the node executable.
+            timeout (float): Seconds one `extract` may take.
+        """
+        self.node = node
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._stderr: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        """
+        Start the Node process on the shared tool script.
+
+        Returns:
+            subprocess.Popen: Running worker process.
+        """
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            [self.node, _tool_script()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+        )
+        return self._proc
+
+    def extract(self, code: str) -> Dict[str, Any]:
+        """
+        Parse `code` in the worker and return its AST summary.
+
+        Args:
+            code (str): Raw JavaScript source.
+
+        Returns:
+            Dict[str, Any]: AST summary or {"error": "..."}.
+        """
+        data = code.encode("utf-8")
+        with self._lock:
+            proc = self._proc
+            if proc is None or proc.poll() is not None:
+                self._stop()  # collect a dead worker before replacing it
+                proc = self._start()
+            # Killing the worker unblocks the pipe I/O below with EOF/EPIPE
+            expired = threading.Event()
+            watchdog = threading.Timer(self.timeout, lambda: (expired.set(), proc.kill()))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                proc.stdin.write(len(data).to_bytes(4, "little") + data)
+                proc.stdin.flush()
+                head = proc.stdout.read(4)
+                if len(head) < 4:
+                    raise EOFError
+                n = int.from_bytes(head, "little")
+                payload = proc.stdout.read(n)
+                if len(payload) < n:
+                    raise EOFError
+            except (BrokenPipeError, EOFError):
+                err = self._stop().strip()
+                if expired.is_set():
+                    return {"error": f"Node execution failed: timed out after {self.timeout:g}s"}
+                # The worker exited (e.g. esprima missing); report its stderr
+                return {"error": f"Node execution failed: {err}"}
+            finally:
+                watchdog.cancel()
+        try:
+            result = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # JS strings may hold lone surrogates, which only `json` accepts
+            result = json.loads(payload)
+        if "error" in result:
+            return {"error": f"Node execution failed: {result['error']}"}
+        return result
+
+    def _stop(self) -> str:
+        """
+        Terminate the Node process, if any.
+
+        Returns:
+            str: The end of what the process wrote to stderr.
+        """
+        proc, self._proc = self._proc, None
+        stderr, self._stderr = self._stderr, None
+        if proc is not None:
+            try:  # closes stdin, which ends the worker's read loop
+                proc.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+        if stderr is None:
+            return ""
+        with stderr:
+            size = stderr.seek(0, os.SEEK_END)
+            stderr.seek(max(0, size - _STDERR_TAIL))
+            return stderr.read().decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """
+        Stop the Node process.
+        """
+        with self._lock:
+            self._stop()
+
+
+# Shared worker, created by the first `try_extract_ast` call
+_worker: Optional[EsprimaWorker] = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker(node: str) -> EsprimaWorker:
+    """
+    Return the shared worker, creating it on first use.
+
+    Args:
+        node (str): Path to the node executable.
+
+    Returns:
+        EsprimaWorker: Worker stopped at interpreter exit.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or _worker.node != node:
+            if _worker is not None:
+                _worker.close()
+            else:
+                atexit.register(_close_worker)
+            _worker = EsprimaWorker(node)
+        return _worker
+
+
+def _close_worker() -> None:
+    """
+    Stop the shared worker (registered with `atexit`).
+    """
+    if _worker is not None:
+        _worker.close()
+
+
 def try_extract_ast(code: str) -> Dict[str, Any]:
     """
     Extract JS AST info using Node + esprima.
@@ -129,25 +360,7 @@ def try_extract_ast(code: str) -> Dict[str, Any]:
     if not node:
         return {"error": "Node.js not found in PATH."}
 
-    # Create temporary source file
-    with tempfile.NamedTemporaryFile("w+", suffix=".js", delete=False, encoding="utf-8") as src_f:
-        src_f.write(code)
-        src_f.flush()
-        src_path = src_f.name
-
-    # Create temporary tool script file
-    with tempfile.NamedTemporaryFile("w+", suffix=".js", delete=False, encoding="utf-8") as tool_f:
-        tool_f.write(_NODE_SCRIPT)
-        tool_f.flush()
-        tool_path = tool_f.name
-
     try:
-        # Execute Node script to extract AST
-        out = subprocess.check_output([node, tool_path, src_path], stderr=subprocess.STDOUT, text=True)
-        return json.loads(out)
-    except subprocess.CalledProcessError as e:
-        return {"error": f"Node execution failed: {e.output.strip()}"}
+        return _get_worker(node).extract(code)
     except Exception as e:  # noqa: BLE001
         return {"error": str(e)}
-
-
@@ -15,11 +15,25 @@ Patterns (conservative):
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Sequence
 
 import jsbeautifier
 
+# Compiled once at import; `run` may be called for every script of a page
+_TOKEN_RE: Pattern[str] = re.compile(r"(token|auth|jwt)[^\n\r\"']{0,40}", re.IGNORECASE)
+_API_RE: Pattern[str] = re.compile(r"['\"](\/api\/[^'\"\s]+)['\"]", re.IGNORECASE)
+_FETCH_RE: Pattern[str] = re.compile(r"fetch\(['\"]([^'\"\)]+)['\"]", re.IGNORECASE)
+_XHR_RE: Pattern[str] = re.compile(
+    r"open\(['\"](GET|POST|PUT|DELETE)['\"],\s*['\"]([^'\"\)]+)['\"]", re.IGNORECASE
+)
+
+# Beautified outputs remembered per tool; bundles are often re-run unchanged
+_BEAUTIFY_CACHE_SIZE = 16
+
 
 class JSBeautifyTool:
     """
@@ -32,6 +46,21 @@ class JSBeautifyTool:
         """
         self.opts = jsbeautifier.default_options()
         self.opts.indent_size = 2
+        # Cached per instance, since the result depends on `self.opts`
+        # (change options before the first `run`, or use a new tool)
+        self._beautify = lru_cache(maxsize=_BEAUTIFY_CACHE_SIZE)(self._beautify_uncached)
+
+    def _beautify_uncached(self, code: str) -> str:
+        """
+        Beautify `code` with this tool's options.
+
+        Args:
+            code (str): Raw JavaScript code.
+
+        Returns:
+            str: Beautified code.
+        """
+        return jsbeautifier.beautify(code, self.opts)
 
     def run(self, code: str) -> Dict[str, Any]:
         """
@@ -43,17 +72,53 @@ class JSBeautifyTool:
         Returns:
             Dict[str, Any]: Dictionary containing beautified code and pattern matches.
         """
-        # Beautify code
-        pretty = jsbeautifier.beautify(code, self.opts)
-        # Run pattern matching
-        patterns = {
-            "token_like": re.findall(r"(token|auth|jwt)[^\n\r\"']{0,40}", code, flags=re.IGNORECASE),
-            "api_paths": re.findall(r"['\"](\/api\/[^'\"\s]+)['\"]", code, flags=re.IGNORECASE),
-            "fetch_calls": re.findall(r"fetch\(['\"]([^'\"\)]+)['\"]", code, flags=re.IGNORECASE),
-            "xhr_open": re.findall(
-                r"open\(['\"](GET|POST|PUT|DELETE)['\"],\s*['\"]([^'\"\)]+)['\"]", code, flags=re.IGNORECASE
-            ),
-        }
-        return {"beautified": pretty, "patterns": patterns}
+        # Beautify code (identical inputs are served from the cache)
+        pretty = self._beautify(code)
+        return {"beautified": pretty, "patterns": _find_patterns(code)}
+
+    def run_many(self, codes: Sequence[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run `run` on several scripts, beautifying them in worker processes.
+
+        Beautification is pure Python and CPU-bound, so it only scales across
+        processes; the hint regexes are cheap and run here. A single script
+        (or `workers=1`) is handled in-process, through the cache.
+
+        Args:
+            codes (Sequence[str]): Raw JavaScript sources.
+            workers (Optional[int]): Worker processes (default: CPU count).
+
+        Returns:
+            List[Dict[str, Any]]: One `run` result per input, in order.
+        """
+        workers = workers or os.cpu_count() or 1
+        if len(codes) < 2 or workers == 1:
+            return [self.run(code) for code in codes]
+        # The options object does not pickle (its `raw_options` is a dynamic
+        # class); its resolved values, as a plain dict, are accepted as well
+        opts = {k: v for k, v in vars(self.opts).items() if k != "raw_options"}
+        with ProcessPoolExecutor(max_workers=min(workers, len(codes))) as ex:
+            pretty = list(ex.map(jsbeautifier.beautify, codes, [opts] * len(codes)))
+        return [
+            {"beautified": p, "patterns": _find_patterns(code)} for code, p in zip(codes, pretty)
+        ]
+
+
+def _find_patterns(code: str) -> Dict[str, List[Any]]:
+    """
+    Run the hint regexes over raw code.
+
+    Args:
+        code (str): Raw JavaScript code.
+
+    Returns:
+        Dict[str, List[Any]]: Matches per pattern kind.
+    """
+    return {
+        "token_like": _TOKEN_RE.findall(code),
+        "api_paths": _API_RE.findall(code),
+        "fetch_calls": _FETCH_RE.findall(code),
+        "xhr_open": _XHR_RE.findall(code),
+    }
 
 
@@ -10,35 +10,161 @@ Usage
 -----
 with BrowserSession(har_path="traffic.har") as page:
     page.goto("https://example.com", wait_until="networkidle")
+
+Several captures can share one browser process, paying its startup once:
+
+with launch_browser() as browser:
+    for i, url in enumerate(urls):
+        with BrowserSession(f"traffic_{i}.har", browser=browser) as page:
+            page.goto(url)
+
+Or, when captures are not scoped to one block, keep a process-wide browser
+warm between sessions (closed at interpreter exit):
+
+with BrowserSession("traffic.har", reuse=True) as page:
+    page.goto(url)
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Collection, Dict, FrozenSet, Generator, Literal, Optional, Pattern, Union
 
-from playwright.sync_api import Page, Playwright, sync_playwright
+from playwright.sync_api import Browser, Page, Playwright, Route, sync_playwright
 
 logger = logging.getLogger(__name__)
 
+# Resource types that carry no API traffic; pass as `block_resources` to skip them
+ASSET_RESOURCE_TYPES: FrozenSet[str] = frozenset({"image", "media", "font", "stylesheet"})
+
+# Process-wide Playwright driver and browsers (one per headless mode), started
+# on first use by `shared_browser` and stopped at interpreter exit
+_singleton_pw: Optional[Playwright] = None
+_singleton_browsers: Dict[bool, Browser] = {}
+_singleton_lock = threading.Lock()
+
+
+@contextmanager
+def launch_browser(headless: bool = True) -> Generator[Browser, None, None]:
+    """
+    Start Playwright and a single Chromium instance to share between sessions.
+
+    Args:
+        headless (bool): Whether to run browser in headless mode.
+
+    Yields:
+        Browser: Launched browser; closed (with Playwright) on exit.
+    """
+    pw = sync_playwright().start()
+    try:
+        browser = pw.chromium.launch(headless=headless)
+        logger.info("Shared browser launched")
+        try:
+            yield browser
+        finally:
+            browser.close()
+    finally:
+        pw.stop()
+        logger.info("Shared browser closed")
+
+
+def shared_browser(headless: bool = True) -> Browser:
+    """
+    Return the process-wide browser, launching it on first use.
+
+    Unlike `launch_browser`, the browser is not tied to a `with` block: it
+    stays warm across `BrowserSession(..., reuse=True)` captures and is closed
+    by an `atexit` hook. Playwright's sync API is bound to the thread that
+    started it, so use it from one thread only.
+
+    Args:
+        headless (bool): Whether to run browser in headless mode.
+
+    Returns:
+        Browser: Shared browser for the requested mode.
+    """
+    global _singleton_pw
+    with _singleton_lock:
+        browser = _singleton_browsers.get(headless)
+        if browser is None:
+            if _singleton_pw is None:
+                _singleton_pw = sync_playwright().start()
+                atexit.register(close_shared_browser)
+            browser = _singleton_pw.chromium.launch(headless=headless)
+            _singleton_browsers[headless] = browser
+            logger.info("Shared browser launched (headless=%s)", headless)
+        return browser
+
+
+def close_shared_browser() -> None:
+    """
+    Close the browsers started by `shared_browser` and stop Playwright.
+
+    Registered with `atexit`; safe to call earlier and more than once.
+    """
+    global _singleton_pw
+    with _singleton_lock:
+        for browser in _singleton_browsers.values():
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning("Error closing shared browser: %s", e)
+        _singleton_browsers.clear()
+        if _singleton_pw is not None:
+            try:
+                _singleton_pw.stop()
+            except Exception as e:
+                logger.warning("Error stopping playwright: %s", e)
+            _singleton_pw = None
+
 
 class BrowserSession:
     """
     Context manager wrapping Playwright to capture traffic as HAR.
     """
 
-    def __init__(self, har_path: str, headless: bool = True) -> None:
+    def __init__(
+        self,
+        har_path: str,
+        headless: bool = True,
+        browser: Optional[Browser] = None,
+        reuse: bool = False,
+        har_content: Literal["omit", "embed", "attach"] = "omit",
+        har_url_filter: Optional[Union[str, Pattern[str]]] = None,
+        block_resources: Optional[Collection[str]] = None,
+    ) -> None:
         """
         Initialize browser session.
 
         Args:
             har_path (str): Path to save HAR file.
             headless (bool): Whether to run browser in headless mode.
+            browser (Optional[Browser]): Already running browser (see
+                `launch_browser`); the session then only opens and closes its
+                own recording context. `headless` is ignored in that case.
+            reuse (bool): Record in the process-wide `shared_browser`, left
+                running after the session, instead of launching a new one.
+            har_content (str): Playwright `record_har_content` mode. Response
+                bodies are omitted by default – the analysis only reads URLs,
+                headers and request bodies, and embedded base64 bodies make
+                the HAR several times larger. Pass "embed" to keep them.
+            har_url_filter (Optional[Union[str, Pattern[str]]]): Glob or
+                regex; only matching requests are recorded (all if None).
+            block_resources (Optional[Collection[str]]): Playwright resource
+                types to abort instead of loading (e.g. `ASSET_RESOURCE_TYPES`);
+                pages load faster and the HAR keeps fewer entries.
         """
         self.har_path = Path(har_path).expanduser().resolve()
         self.headless = headless
+        self.browser = browser
+        self.reuse = reuse
+        self.har_content = har_content
+        self.har_url_filter = har_url_filter
+        self.block_resources = frozenset(block_resources or ())
         self._pw: Optional[Playwright] = None
         self.page: Optional[Page] = None
 
@@ -52,13 +178,35 @@ class BrowserSession:
         Returns:
             Page: Playwright page object.
         """
-        self._pw = sync_playwright().start()
-        browser = self._pw.chromium.launch(headless=self.headless)
-        ctx = browser.new_context(record_har_path=str(self.har_path))
+        browser = self.browser
+        if browser is None and self.reuse:
+            browser = shared_browser(self.headless)
+        if browser is None:
+            self._pw = sync_playwright().start()
+            browser = self._pw.chromium.launch(headless=self.headless)
+        ctx = browser.new_context(
+            record_har_path=str(self.har_path),
+            record_har_content=self.har_content,
+            record_har_url_filter=self.har_url_filter,
+        )
         self.page = ctx.new_page()
+        if self.block_resources:
+            self.page.route("**/*", self._route)
         logger.info("Browser started; HAR -> %s", self.har_path)
         return self.page
 
+    def _route(self, route: Route) -> None:
+        """
+        Abort requests of a blocked resource type, let the rest through.
+
+        Args:
+            route (Route): Intercepted request.
+        """
+        if route.request.resource_type in self.block_resources:
+            route.abort()
+        else:
+            route.continue_()
+
     def __exit__(self, exc_type, exc, tb):  # noqa: D401
         """
         Exit context manager, close browser and save HAR file.
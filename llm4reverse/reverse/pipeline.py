@@ -17,20 +17,44 @@ Steps
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import mmap
+import re
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
-from llm4reverse.reverse.collectors.browser import BrowserSession
-from llm4reverse.reverse.agents.har_agent import run_har_agent
+import orjson
+from playwright.sync_api import Browser
+
+from llm4reverse.reverse.collectors.browser import ASSET_RESOURCE_TYPES, BrowserSession, launch_browser
+from llm4reverse.reverse.agents.har_agent import project_har, project_har_entry, run_har_agent
 from llm4reverse.reverse import report as report_writer
+from llm4reverse.report import write_json
+
+# Optional: stream large HARs entry by entry instead of parsing them whole
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 logger = logging.getLogger(__name__)
 
+# HARs larger than this are streamed when ijson is installed
+STREAM_HAR_BYTES = 50 * 1024 * 1024
 
-def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout: int = 30) -> None:
+
+def run_dynamic_reverse(
+    url: str,
+    out_dir: str,
+    headless: bool = True,
+    timeout: int = 30,
+    browser: Optional[Browser] = None,
+    reuse_browser: bool = False,
+    block_resources: Optional[Collection[str]] = None,
+) -> None:
     """
     Capture runtime traffic (HAR) and let an LLM analyse it.
 
@@ -39,6 +63,12 @@ def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout:
         out_dir (str): Directory where artifacts will be stored.
         headless (bool): Launch browser in headless mode if True.
         timeout (int): Extra seconds to wait after 'networkidle'.
+        browser (Optional[Browser]): Shared browser to record in instead of
+            launching a new one (see `run_dynamic_reverse_many`).
+        reuse_browser (bool): Record in the process-wide browser kept warm
+            between calls (closed at exit) instead of launching a new one.
+        block_resources (Optional[Collection[str]]): Resource types not to
+            load, e.g. `ASSET_RESOURCE_TYPES` (images, media, fonts, CSS).
     """
     t0 = time.perf_counter()
     logger.info("Starting dynamic reverse engineering for: %s", url)
@@ -52,7 +82,13 @@ def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout:
     # Step 1: Record HAR via Playwright
     logger.info("Step 1/3: Starting browser session...")
     t1 = time.perf_counter()
-    with BrowserSession(str(har_file), headless=headless) as page:
+    with BrowserSession(
+        str(har_file),
+        headless=headless,
+        browser=browser,
+        reuse=reuse_browser,
+        block_resources=block_resources,
+    ) as page:
         try:
             logger.info("Navigating to %s (waiting for networkidle)...", url)
             page.goto(url, wait_until="networkidle")  # Prefer full quiet
@@ -81,10 +117,10 @@ def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout:
     
     # 验证 HAR 文件是否为有效的 JSON，并加载数据供后续使用
     try:
-        har_dict = json.loads(har_file.read_text(encoding="utf-8", errors="ignore"))
+        har_dict = _load_har(har_file)
         if not isinstance(har_dict, dict) or "log" not in har_dict:
             logger.warning("HAR file structure may be invalid (missing 'log' key)")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error("HAR file is not valid JSON: %s", e)
         raise ValueError(f"Invalid HAR file format: {e}") from e
 
@@ -94,7 +130,7 @@ def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout:
     findings, trace = run_har_agent(har_dict)
     logger.info("LLM reasoning completed (took %.2fs)", time.perf_counter() - t2)
     
-    (out / "reverse_trace.json").write_text(json.dumps(trace, ensure_ascii=False, indent=2))
+    write_json(out / "reverse_trace.json", trace)
     logger.info("Trace saved: %d events recorded", len(trace))
 
     # Step 3: Persist reports
@@ -106,6 +142,92 @@ def run_dynamic_reverse(url: str, out_dir: str, headless: bool = True, timeout:
     logger.info("Reverse finished in %.2fs (total)", time.perf_counter() - t0)
 
 
+def _load_har(har_file: Path) -> Any:
+    """
+    Parse a HAR file, keeping only the fields the analysis reads.
+
+    Files above `STREAM_HAR_BYTES` are streamed entry by entry with ijson when
+    it is installed, so the full document is never built. Otherwise the file
+    is parsed straight from a read-only `mmap` with orjson, which avoids
+    holding it as a Python string next to the parsed objects; files that are
+    not valid UTF-8 are retried with undecodable bytes dropped, as a text-mode
+    read with `errors="ignore"` would. Either way entries are reduced with
+    `project_har_entry`.
+
+    Args:
+        har_file (Path): HAR file to parse.
+
+    Returns:
+        Any: Projected HAR document.
+
+    Raises:
+        orjson.JSONDecodeError: If the file is not valid JSON.
+    """
+    size = har_file.stat().st_size
+    if HAS_IJSON and size > STREAM_HAR_BYTES:
+        try:
+            with har_file.open("rb") as fh:
+                entries = ijson.items(fh, "log.entries.item", use_float=True)
+                return {"log": {"entries": [project_har_entry(e) for e in entries]}}
+        except ijson.JSONError as e:
+            logger.warning("Streaming HAR parse failed (%s); parsing the whole file", e)
+
+    with har_file.open("rb") as fh:
+        # Zero-length files cannot be mapped
+        if size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                with memoryview(mm) as view:
+                    har_dict = orjson.loads(view)
+            except orjson.JSONDecodeError:
+                har_dict = orjson.loads(str(mm, "utf-8", "ignore"))
+    # The full document is freed on return
+    return project_har(har_dict)
+
+
+def run_dynamic_reverse_many(
+    urls: Sequence[str],
+    out_dir: str,
+    headless: bool = True,
+    timeout: int = 30,
+    block_resources: Optional[Collection[str]] = None,
+) -> int:
+    """
+    Reverse several pages with one browser launch.
+
+    Each URL gets its own recording context and its own output sub-directory,
+    named after its position and host (e.g. `01_example.com`). A failing URL is
+    logged and does not stop the others.
+
+    Args:
+        urls (Sequence[str]): Target webpage URLs.
+        out_dir (str): Parent directory of the per-URL artifact directories.
+        headless (bool): Launch browser in headless mode if True.
+        timeout (int): Extra seconds to wait after 'networkidle'.
+        block_resources (Optional[Collection[str]]): Resource types not to
+            load (see `run_dynamic_reverse`).
+
+    Returns:
+        int: Number of URLs that failed.
+    """
+    failed = 0
+    width = len(str(len(urls)))
+    with launch_browser(headless=headless) as browser:
+        for i, url in enumerate(urls, 1):
+            host = re.sub(r"[^A-Za-z0-9.-]+", "_", urlsplit(url).netloc) or "page"
+            target = Path(out_dir) / f"{i:0{width}d}_{host}"
+            try:
+                run_dynamic_reverse(
+                    url, str(target), headless, timeout, browser=browser, block_resources=block_resources
+                )
+            except Exception:
+                logger.exception("Reverse failed for %s", url)
+                failed += 1
+    logger.info("Reversed %d/%d URLs", len(urls) - failed, len(urls))
+    return failed
+
+
 # --------------------------------------------------------------------------- #
 # CLI helper
 # --------------------------------------------------------------------------- #
@@ -121,6 +243,9 @@ def _parse() -> argparse.Namespace:
     p.add_argument("--output", default="./reverse_out", help="Output directory.")
     p.add_argument("--no-headless", action="store_true", help="Run browser in UI mode.")
     p.add_argument("--timeout", type=int, default=30, help="Extra wait after networkidle (seconds).")
+    p.add_argument(
+        "--block-assets", action="store_true", help="Do not load images, media, fonts and stylesheets."
+    )
     return p.parse_args()
 
 
@@ -133,7 +258,13 @@ def main() -> None:
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     args = _parse()
-    run_dynamic_reverse(args.url, args.output, not args.no_headless, args.timeout)
+    run_dynamic_reverse(
+        args.url,
+        args.output,
+        not args.no_headless,
+        args.timeout,
+        block_resources=ASSET_RESOURCE_TYPES if args.block_assets else None,
+    )
 
 
 if __name__ == "__main__":
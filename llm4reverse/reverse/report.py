@@ -9,10 +9,11 @@ Write JSON + Markdown report after dynamic reverse-engineering.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List, Dict
 
+from llm4reverse.report import dumps_json
+
 
 def write_reverse_report(findings: List[Dict], out_dir: Path) -> None:
     """
@@ -23,18 +24,20 @@ def write_reverse_report(findings: List[Dict], out_dir: Path) -> None:
         out_dir (Path): Output directory.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
-    findings_json = json.dumps(findings, ensure_ascii=False, indent=2)
+    findings_json = dumps_json(findings)
     # Write to two filenames for compatibility (reverse_report.json for backward compatibility, reverse_findings.json for tests)
-    (out_dir / "reverse_report.json").write_text(findings_json)
-    (out_dir / "reverse_findings.json").write_text(findings_json)
-
-    md_lines = ["# Dynamic Reverse Report\n"]
+    # Two independent files; unlinking first also separates the hard-linked
+    # pair written by earlier versions, so editing one never changes the other
+    compat_json = out_dir / "reverse_findings.json"
+    compat_json.unlink(missing_ok=True)
+    (out_dir / "reverse_report.json").write_bytes(findings_json)
+    compat_json.write_bytes(findings_json)
+
+    # Assembled as UTF-8 bytes so orjson output is appended without decoding
+    md = bytearray(b"# Dynamic Reverse Report\n")
     for item in findings:
-        md_lines.append(f"## `{item['method']}` {item['url']}")
-        md_lines.append("")
-        md_lines.append("```json")
-        md_lines.append(json.dumps(item, ensure_ascii=False, indent=2))
-        md_lines.append("```")
-        md_lines.append("")
-
-    (out_dir / "reverse_report.md").write_text("\n".join(md_lines))
+        md += f"\n## `{item['method']}` {item['url']}\n\n```json\n".encode("utf-8")
+        md += dumps_json(item)
+        md += b"\n```\n"
+
+    (out_dir / "reverse_report.md").write_bytes(md)
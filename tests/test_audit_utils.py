@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+test_audit_utils.py
+Tests - Audit Utils
+=====================
+
+`LineIndex` and `looks_minified`.
+"""
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from llm4reverse.audit.utils import LineIndex, looks_minified
+
+TEXT = "a\nbb\n\nccc\nd"
+
+
+@pytest.mark.parametrize("text", [TEXT, TEXT.encode("utf-8")])
+def test_line_of_matches_newline_count(text) -> None:
+    index = LineIndex(text)
+
+    assert [index.line_of(pos) for pos in range(len(text) + 1)] == [
+        text.count("\n" if isinstance(text, str) else b"\n", 0, pos) + 1 for pos in range(len(text) + 1)
+    ]
+
+
+def test_line_index_is_built_on_first_lookup() -> None:
+    index = LineIndex(TEXT)
+    assert index._newlines is None
+
+    index.line_of(0)
+    assert index._newlines == [1, 4, 5, 9]
+
+
+@pytest.mark.parametrize("name", ["app.min.js", "vendor.bundle.js"])
+def test_minified_by_name(name: str) -> None:
+    assert looks_minified(name, b"short\nlines\n")
+
+
+def test_minified_by_long_line_near_the_top() -> None:
+    assert looks_minified("app.js", b"x" * 2001)
+    assert not looks_minified("app.js", b"x" * 2000 + b"\n" + b"y" * 2000)
+
+
+def test_long_line_after_the_head_is_not_inspected() -> None:
+    data = b"short line\n" * 400 + b"x" * 5000
+
+    assert not looks_minified("app.js", data)
+
+
+def test_looks_minified_reads_mmap(tmp_path: Path) -> None:
+    path = tmp_path / "app.js"
+    path.write_bytes(b"x" * 3000)
+
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert looks_minified(path.name, mm)
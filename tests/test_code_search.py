@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+test_code_search.py
+Tests - Audit Tools
+=====================
+
+The `code_search` and `code_search_many` tools.
+"""
+
+import pytest
+
+from llm4reverse.audit.resolvers.symbol_index import SymbolIndex
+from llm4reverse.audit.tools.code_search import _make_code_search_many_tool, _make_code_search_tool
+
+SOURCE = "const foo = a || b;\nfunction bar(x) { return x | 0; }\n"
+
+
+@pytest.fixture
+def index() -> SymbolIndex:
+    index = SymbolIndex()
+    index.feed("a.js", SOURCE)
+    index.finalize()
+    return index
+
+
+def test_code_search_treats_pipes_as_part_of_the_query(index: SymbolIndex) -> None:
+    out = _make_code_search_tool(index).func(" a || b ")
+
+    assert out.startswith("Matches for `a || b`:")
+    assert "- a.js:1\n" in out and "- a.js:2\n" not in out
+
+
+def test_code_search_not_found(index: SymbolIndex) -> None:
+    assert _make_code_search_tool(index).func("nothing") == "No matches for `nothing`"
+
+
+def test_code_search_many_reports_each_query(index: SymbolIndex) -> None:
+    out = _make_code_search_many_tool(index).func('["x | 0", " ", "zzz"]')
+
+    sections = out.split("\n\n")
+    assert sections[0].startswith("Matches for `x | 0`:")
+    assert sections[1] == "No matches for `zzz`"
+    assert len(sections) == 2
+
+
+def test_code_search_many_matches_single_searches(index: SymbolIndex) -> None:
+    single = _make_code_search_tool(index).func
+
+    out = _make_code_search_many_tool(index).func('["foo", "bar"]')
+
+    assert out == single("foo") + "\n\n" + single("bar")
+
+
+@pytest.mark.parametrize("raw", ["foo", "a || b", '{"q": "foo"}', '["foo", 1]', "[unclosed"])
+def test_code_search_many_rejects_non_string_arrays(index: SymbolIndex, raw: str) -> None:
+    assert _make_code_search_many_tool(index).func(raw).startswith("ERROR: expected a JSON array of strings")
+
+
+def test_code_search_many_without_queries(index: SymbolIndex) -> None:
+    assert _make_code_search_many_tool(index).func("[]") == "No queries given"
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+test_endpoint_agent.py
+Tests - Audit Agents
+=====================
+
+Batch enrichment in `endpoint_agent`, driven by a stub chat model.
+"""
+
+import asyncio
+import json
+import re
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage
+
+from llm4reverse.audit.agents import endpoint_agent
+from llm4reverse.audit.extractors.regex_extractor import Finding
+from llm4reverse.audit.resolvers.symbol_index import SymbolIndex
+
+
+class StubChatModel:
+    """
+    Tool-less chat model answering every `[idx]` entry of a batch.
+
+    Like a pooled HTTP client, it is bound to the event loop of its first call
+    and fails once that loop is closed.
+    """
+
+    model_name = "stub-model"
+
+    def __init__(self, reply: Optional[str] = None) -> None:
+        self.reply = reply
+        self.calls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_tools(self, tools: List[Any], **kwargs: Any) -> "StubChatModel":
+        return self
+
+    async def ainvoke(self, messages: List[BaseMessage], config: Any = None) -> AIMessage:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        elif self._loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        self.calls += 1
+        content = self.reply
+        if content is None:
+            idxs = re.findall(r"^\[(\d+)\]", messages[-1].content, re.MULTILINE)
+            content = json.dumps([{"idx": int(i), "method": "POST", "headers": {"X-I": i}} for i in idxs])
+        return AIMessage(content=content, response_metadata={"finish_reason": "stop"})
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> None:
+    endpoint_agent._ENRICH_CACHE.clear()
+
+
+def _use_model(monkeypatch: pytest.MonkeyPatch, model: StubChatModel) -> StubChatModel:
+    monkeypatch.setattr(endpoint_agent, "get_chat_llm", lambda **kwargs: model)
+    return model
+
+
+def _finding(url: str, line: int = 1, file: str = "a.js") -> Finding:
+    return Finding("http", "GET", url, file, line, f"fetch('{url}')")
+
+
+def test_run_trace_twice_in_one_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = _use_model(monkeypatch, StubChatModel())
+
+    first = [_finding("/a")]
+    endpoint_agent.run_trace(first, SymbolIndex(), None)
+    second = [_finding("/b")]
+    endpoint_agent.run_trace(second, SymbolIndex(), None)
+
+    assert model.calls == 2
+    assert [f.method for f in first + second] == ["POST", "POST"]
+
+
+# ------------------------------ batch parsing ------------------------------ #
+def test_enrichments_are_scattered_by_idx(monkeypatch: pytest.MonkeyPatch) -> None:
+    reply = json.dumps([
+        {"idx": 2, "method": "PUT", "headers": {"A": "2"}},
+        {"idx": "0", "method": "POST"},
+        {"idx": 7, "method": "OUT_OF_RANGE"},
+        {"method": "NO_IDX"},
+        "not an object",
+    ])
+    _use_model(monkeypatch, StubChatModel(reply))
+    findings = [_finding("/a", 1), _finding("/b", 2), _finding("/c", 3)]
+
+    endpoint_agent.run_trace(findings, SymbolIndex(), None, batch_size=3)
+
+    assert [f.method for f in findings] == ["POST", "GET", "PUT"]
+    assert findings[2].headers == {"A": "2"}
+    assert all(f.enrichment == [] for f in findings)
+
+
+def test_bare_object_answers_a_batch_of_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_model(monkeypatch, StubChatModel('{"method": "DELETE", "params": {"id": "int"}}'))
+    finding = _finding("/a")
+
+    endpoint_agent.run_trace([finding], SymbolIndex(), None, batch_size=1)
+
+    assert (finding.method, finding.params) == ("DELETE", {"id": "int"})
+
+
+def test_fenced_answer_is_parsed(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_model(monkeypatch, StubChatModel('```json\n[{"idx": 0, "method": "PATCH"}]\n```'))
+    finding = _finding("/a")
+
+    endpoint_agent.run_trace([finding], SymbolIndex(), None)
+
+    assert finding.method == "PATCH"
+    assert finding.enrichment == []
+
+
+def test_raw_answer_is_kept_once_per_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_model(monkeypatch, StubChatModel("I could not work it out."))
+    findings = [_finding("/a", 1), _finding("/b", 2), _finding("/c", 3)]
+
+    endpoint_agent.run_trace(findings, SymbolIndex(), None, batch_size=3)
+
+    assert findings[0].enrichment == ["I could not work it out."]
+    assert findings[1].enrichment == findings[2].enrichment == ["Raw batch answer kept with a.js:1"]
+
+
+# --------------------------------- caching --------------------------------- #
+def test_duplicate_sites_are_enriched_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = _use_model(monkeypatch, StubChatModel())
+    findings = [_finding("/a", 1, "a.js"), _finding("/a", 9, "b.js"), _finding("/b", 2, "a.js")]
+
+    endpoint_agent.run_trace(findings, SymbolIndex(), None, batch_size=1)
+
+    assert model.calls == 2
+    assert [f.method for f in findings] == ["POST", "POST", "POST"]
+    assert findings[1].headers == findings[0].headers
+
+
+def test_in_process_cache_serves_later_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = _use_model(monkeypatch, StubChatModel())
+    endpoint_agent.run_trace([_finding("/a")], SymbolIndex(), None)
+
+    again = _finding("/a", 5, "other.js")
+    endpoint_agent.run_trace([again], SymbolIndex(), None)
+
+    assert model.calls == 1
+    assert again.method == "POST"
+
+
+def test_in_process_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(endpoint_agent, "_ENRICH_CACHE_SIZE", 2)
+    _use_model(monkeypatch, StubChatModel())
+
+    endpoint_agent.run_trace([_finding(f"/{i}", i) for i in range(5)], SymbolIndex(), None)
+
+    assert len(endpoint_agent._ENRICH_CACHE) == 2
+
+
+def test_cache_file_only_holds_its_project(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    model = _use_model(monkeypatch, StubChatModel())
+    cache_a, cache_b = tmp_path / "a.json", tmp_path / "b.json"
+    endpoint_agent.run_trace([_finding("/only-in-a")], SymbolIndex(), None, cache_path=cache_a)
+    endpoint_agent.run_trace([_finding("/b")], SymbolIndex(), None, cache_path=cache_b)
+
+    entries_a = json.loads(cache_a.read_text(encoding="utf-8"))["entries"]
+    entries_b = json.loads(cache_b.read_text(encoding="utf-8"))["entries"]
+    assert len(entries_a) == len(entries_b) == 1
+    assert not set(entries_a) & set(entries_b)
+
+    # A fresh process reuses the file without calling the model
+    endpoint_agent._ENRICH_CACHE.clear()
+    calls = model.calls
+    again = _finding("/only-in-a")
+    endpoint_agent.run_trace([again], SymbolIndex(), None, cache_path=cache_a)
+    assert model.calls == calls
+    assert again.method == "POST"
+
+
+# ------------------------------ prompt & rounds ---------------------------- #
+def test_clamp_snippet_keeps_head_and_tail() -> None:
+    assert endpoint_agent._clamp_snippet("short", max_chars=10) == "short"
+    assert endpoint_agent._clamp_snippet("x" * 10, max_chars=10) == "x" * 10
+    assert endpoint_agent._clamp_snippet("abcdefghijkl", max_chars=6) == "abc…jkl"
+
+
+class ScriptedModel:
+    """Chat model replaying canned responses and checking tool-call pairing like the API."""
+
+    def __init__(self, responses: List[AIMessage]) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, messages: List[BaseMessage], config: Any = None) -> AIMessage:
+        for i, message in enumerate(messages):
+            if isinstance(message, AIMessage) and message.tool_calls:
+                answered = {getattr(m, "tool_call_id", None) for m in messages[i + 1:]}
+                assert {c["id"] for c in message.tool_calls} <= answered, "unanswered tool_calls"
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def _reply(content: str, finish_reason: str = "stop", tool: bool = False) -> AIMessage:
+    tool_calls = [{"name": "missing_tool", "args": {}, "id": f"call-{content}"}] if tool else []
+    return AIMessage(content=content, tool_calls=tool_calls, response_metadata={"finish_reason": finish_reason})
+
+
+def _ainvoke(model: ScriptedModel) -> str:
+    return asyncio.run(endpoint_agent._ainvoke_with_tools(model, {}, [], {}))
+
+
+def test_truncated_answer_is_continued() -> None:
+    model = ScriptedModel([_reply("[{", "length"), _reply('"idx": 0}]')])
+
+    assert _ainvoke(model) == '[{"idx": 0}]'
+
+
+def test_answer_still_requesting_tools_is_not_continued() -> None:
+    rounds = endpoint_agent.MAX_TOOL_ROUNDS
+    model = ScriptedModel([_reply(str(i), "length", tool=True) for i in range(rounds + 1)])
+
+    assert _ainvoke(model) == str(rounds)
+    assert model.calls == rounds + 1
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+test_har_agent.py
+Tests - Reverse Agents
+=====================
+
+HAR projection, the HarSearch view and answer parsing in `har_agent`.
+"""
+
+import copy
+import json
+
+import pytest
+
+from llm4reverse.reverse.agents.har_agent import (
+    _extract_json_from_text,
+    _make_har_search_tool,
+    _slim_headers,
+    project_har,
+    project_har_entry,
+)
+
+ENTRY = {
+    "startedDateTime": "2024-01-01T00:00:00Z",
+    "timings": {"wait": 1},
+    "request": {
+        "url": "https://api.example.com/v1/items?q=1",
+        "method": "POST",
+        "headers": [{"name": "Authorization", "value": "Bearer t"}],
+        "queryString": [{"name": "q", "value": "1"}],
+        "cookies": [{"name": "sid", "value": "s"}],
+        "postData": {"mimeType": "application/json", "text": '{"a": 1}'},
+    },
+    "response": {
+        "status": 201,
+        "headers": [{"name": "Content-Type", "value": "application/json"}],
+        "content": {"size": 10, "text": "{}"},
+    },
+}
+
+
+# ------------------------------ answer parsing ----------------------------- #
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('[{"url": "/a"}]', [{"url": "/a"}]),
+        ('  [[1], [2]]\n', [[1], [2]]),
+        ('Here you go:\n[{"url": "/a"}]\nDone.', [{"url": "/a"}]),
+        ('See [1] below:\n```json\n[{"url": "/b"}]\n```', [{"url": "/b"}]),
+        ("noise [1, 2] and a stray ] here", [1, 2]),
+    ],
+)
+def test_extract_json_from_text(text: str, expected) -> None:
+    assert _extract_json_from_text(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "no json here", '{"url": "/a"}', "[not json]"])
+def test_extract_json_from_text_without_array(text: str) -> None:
+    assert _extract_json_from_text(text) is None
+
+
+# -------------------------------- projection ------------------------------- #
+def test_project_har_keeps_only_read_fields() -> None:
+    har = {"log": {"version": "1.2", "entries": [ENTRY]}}
+
+    assert project_har(har) == {
+        "log": {
+            "entries": [
+                {
+                    "request": {
+                        "url": "https://api.example.com/v1/items?q=1",
+                        "method": "POST",
+                        "headers": [{"name": "Authorization", "value": "Bearer t"}],
+                        "queryString": [{"name": "q", "value": "1"}],
+                        "postData": {"text": '{"a": 1}'},
+                    },
+                    "response": {
+                        "status": 201,
+                        "headers": [{"name": "Content-Type", "value": "application/json"}],
+                    },
+                }
+            ]
+        }
+    }
+
+
+def test_project_har_entry_leaves_absent_keys_absent() -> None:
+    assert project_har_entry({"request": {"url": "/a"}}) == {"request": {"url": "/a"}}
+    assert project_har_entry({"timings": {}}) == {}
+    assert project_har_entry("not an entry") == "not an entry"
+
+
+def test_project_har_returns_unexpected_shapes_unchanged() -> None:
+    assert project_har([]) == []
+    assert project_har({"log": None}) == {"log": None}
+
+
+# ------------------------------ HarSearch view ----------------------------- #
+def test_slim_headers_keeps_first_three_and_truncates() -> None:
+    headers = [
+        {"name": "A", "value": "x" * 80},
+        {"name": "B", "value": "y" * 100},
+        {"name": "C", "value": 7},
+        {"name": "D", "value": "dropped"},
+    ]
+    original = copy.deepcopy(headers)
+
+    assert _slim_headers(headers) == [
+        {"name": "A", "value": "x" * 80},
+        {"name": "B", "value": "y" * 80 + "…[+20]"},
+        {"name": "C", "value": 7},
+    ]
+    assert headers == original
+
+
+def test_har_search_returns_slim_sorted_views() -> None:
+    entry = copy.deepcopy(ENTRY)
+    entry["request"]["headers"] = [{"name": f"H{i}", "value": "v" * 90} for i in range(5)]
+    har = {"log": {"entries": [entry] * 12 + [{"request": {"url": "https://other.example.com/"}}]}}
+    original = copy.deepcopy(har)
+
+    out = _make_har_search_tool(har).func("API.EXAMPLE.COM/V1")
+    matches = json.loads(out)
+
+    assert len(matches) == 10
+    assert list(matches[0]) == sorted(matches[0])
+    assert matches[0]["status"] == 201
+    assert [h["value"] for h in matches[0]["req_headers"]] == ["v" * 80 + "…[+10]"] * 3
+    assert har == original
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+test_regex_extractor.py
+Tests - Audit Extractors
+=====================
+
+Endpoint extraction in `regex_extractor`.
+"""
+
+import mmap
+from pathlib import Path
+from typing import List, Tuple
+
+from llm4reverse.audit.extractors.regex_extractor import Finding, extract_endpoints
+
+SOURCE = (
+    "import x from 'y';\n"
+    "fetch('/api/users?id=1').then(r => r);\n"
+    'axios.post("https://api.example.com/v1/items", body);\n'
+    "const ws = new WebSocket('wss://rt.example.com/socket');\n"
+    "// operationName: 'Q'\n"
+    "const u = 'https://cdn.example.com/a.png';\n"
+)
+
+
+def _rows(findings: List[Finding]) -> List[Tuple]:
+    return [(f.type, f.method, f.url, f.file, f.line, f.snippet, f.confidence) for f in findings]
+
+
+def _fetch_urls(findings: List[Finding]) -> List[str]:
+    return [f.url for f in findings if f.type == "http" and f.confidence == 0.8]
+
+
+def test_extracts_each_kind_of_endpoint() -> None:
+    found = {(f.type, f.method, f.url, f.line) for f in extract_endpoints(SOURCE, "a.js")}
+
+    assert ("http", None, "/api/users?id=1", 2) in found
+    assert ("http", "post", "https://api.example.com/v1/items", 3) in found
+    assert ("http", "GET", "https://cdn.example.com/a.png", 6) in found
+    assert ("ws", None, "wss://rt.example.com/socket", 4) in found
+    assert ("graphql", None, "", 1) in found
+
+
+def test_axios_url_ends_at_the_matching_quote() -> None:
+    findings = extract_endpoints("axios.get('/a\"b', cfg); axios.delete(\"/c'd\");", "a.js")
+
+    assert {(f.method, f.url) for f in findings if f.confidence == 0.8} == {
+        ("get", '/a"b'),
+        ("delete", "/c'd"),
+    }
+
+
+def test_quoted_urls_are_capped_at_2048_characters() -> None:
+    longest = "a" * 2048
+
+    assert _fetch_urls(extract_endpoints(f"fetch('{longest}')", "a.js")) == [longest]
+    assert _fetch_urls(extract_endpoints(f"fetch('{longest}a')", "a.js")) == []
+
+
+def test_unterminated_quote_yields_no_call() -> None:
+    text = "fetch('/never-closed" + ";x=1" * 1000 + "\nfetch('/ok')\n"
+
+    assert _fetch_urls(extract_endpoints(text, "a.js")) == ["/ok"]
+
+
+def test_duplicates_on_one_line_are_dropped() -> None:
+    text = "fetch('/a');fetch('/a');\nfetch('/a');\n"
+
+    assert [f.line for f in extract_endpoints(text, "a.js") if f.confidence == 0.8] == [1, 2]
+
+
+def test_bytes_and_mmap_match_text(tmp_path: Path) -> None:
+    path = tmp_path / "a.js"
+    path.write_bytes(SOURCE.encode("utf-8"))
+    expected = _rows(extract_endpoints(SOURCE, "a.js"))
+
+    assert _rows(extract_endpoints(SOURCE.encode("utf-8"), "a.js")) == expected
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert _rows(extract_endpoints(mm, "a.js")) == expected
+
+
+def test_crlf_bytes_match_text_mode_read() -> None:
+    from_bytes = extract_endpoints(SOURCE.replace("\n", "\r\n").encode("utf-8"), "a.js")
+    from_text = extract_endpoints(SOURCE, "a.js")
+
+    assert [row[:5] for row in _rows(from_bytes)] == [row[:5] for row in _rows(from_text)]
+    assert not any("\r" in f.snippet for f in from_bytes)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+test_scanner.py
+Tests - Audit Scanner
+=====================
+
+Source file discovery in `scanner`.
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from llm4reverse.audit import scanner
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in (
+        "a.js",
+        "notes.txt",
+        ".js",
+        "src/b.ts",
+        "src/.hidden.js",
+        "src/deep/c.js",
+        "node_modules/pkg/x.js",
+        "src/node_modules/y.js",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("//", encoding="utf-8")
+    return tmp_path
+
+
+def _scan(root: Path) -> List[str]:
+    found = scanner.iter_source_files(str(root), {".js", ".ts"}, {"node_modules"})
+    return [p.relative_to(root).as_posix() for p in found]
+
+
+def test_matching_files_outside_excluded_dirs(tree: Path) -> None:
+    assert sorted(_scan(tree)) == ["a.js", "src/.hidden.js", "src/b.ts", "src/deep/c.js"]
+
+
+def test_files_come_before_subdirectories(tree: Path) -> None:
+    found = _scan(tree)
+
+    assert found[0] == "a.js"
+    assert found.index("src/b.ts") < found.index("src/deep/c.js")
+
+
+def test_excluded_dirs_are_never_listed(tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    listed: List[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        listed.append(Path(path).relative_to(tree).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(scanner.os, "scandir", recording_scandir)
+    _scan(tree)
+
+    assert sorted(listed) == [".", "src", "src/deep"]
+
+
+def test_symlinked_dirs_are_not_followed(tree: Path) -> None:
+    try:
+        (tree / "link").symlink_to(tree / "src", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    assert not any(p.startswith("link/") for p in _scan(tree))
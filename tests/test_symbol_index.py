@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+test_symbol_index.py
+Tests - Audit Resolvers
+=====================
+
+Definition scanning in `SymbolIndex`.
+"""
+
+import pytest
+
+from llm4reverse.audit.resolvers.symbol_index import SymbolIndex
+
+
+def test_scan_definition_split_across_lines_is_indexed_once() -> None:
+    text = "export\nconst foo = 1;\nasync\nfunction bar() {}\n"
+
+    refs = SymbolIndex.scan("a.js", text)
+
+    assert [(r.name, r.line) for r in refs] == [("foo", 1), ("bar", 3)]
+
+
+def test_scan_bytes_matches_text() -> None:
+    text = "export\nconst foo = 1;\nclass Baz {}\nlet x = 2;\n"
+
+    from_text = SymbolIndex.scan("a.js", text)
+    from_bytes = SymbolIndex.scan("a.js", text.encode("utf-8"))
+
+    assert [(r.name, r.line, r.snippet) for r in from_bytes] == [
+        (r.name, r.line, r.snippet) for r in from_text
+    ]
+    assert [r.name for r in from_text] == ["foo", "Baz", "x"]
+
+
+def test_lookup_and_search_have_no_duplicates() -> None:
+    index = SymbolIndex()
+    index.feed("a.js", "export\nconst foo = 1;\n")
+    index.finalize()
+
+    assert [r.line for r in index.lookup("foo")] == [1]
+    assert [r.line for r in index.search("foo")] == [1]
+
+
+# ------------------------------ search index ------------------------------ #
+SEARCH_SOURCE = (
+    "const getUser = (id) => api.getUser(id);\n"
+    "function getUserName(u) { return u.name; }\n"
+    "const baseGetUser = 1;\n"
+    "class UserStore {}\n"
+    "let token = auth.getUserToken();\n"
+    "var x = a === b;\n"
+)
+
+
+def _index() -> SymbolIndex:
+    # One definition per file, so every snippet is a single line
+    index = SymbolIndex()
+    for n, line in enumerate(SEARCH_SOURCE.splitlines()):
+        index.feed(f"{n}.js", line)
+    index.finalize()
+    index._search_entries()  # builds the postings `_candidates` reads
+    return index
+
+
+def _brute_force(index: SymbolIndex, query: str):
+    q = query.lower()
+    return [r for r in index._search_entries() if q in r.snippet_lc or q in r.name_lc]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "getuser",  # unbounded: inside any token
+        ".getuser",  # left-bounded: token starts with it
+        "getuser(",  # right-bounded: token ends with it
+        ".getuser(",  # bounded on both sides: token equals it
+        "GETUSER",  # case-insensitive
+        "api.getuser(id)",  # several tokens
+        "nothing_like_this",
+    ],
+)
+def test_search_matches_brute_force(query: str) -> None:
+    index = _index()
+
+    assert index.search(query) == _brute_force(index, query)
+
+
+def test_candidates_narrow_by_token_position() -> None:
+    index = _index()
+    names = lambda ids: sorted(index._search_entries()[i].name for i in ids)  # noqa: E731
+
+    assert names(index._candidates("getuser")) == ["baseGetUser", "getUser", "getUserName", "token"]
+    assert names(index._candidates(".getuser")) == ["getUser", "getUserName", "token"]
+    assert names(index._candidates("getuser(")) == ["baseGetUser", "getUser"]
+    assert names(index._candidates(".getuser(")) == ["getUser"]
+
+
+@pytest.mark.parametrize("query", ["ge", "===", "  "])
+def test_short_or_tokenless_queries_scan_everything(query: str) -> None:
+    index = _index()
+
+    assert index._candidates(query.lower()) is None
+    assert index.search(query) == _brute_force(index, query)
+
+
+def test_search_many_answers_case_variants_once() -> None:
+    index = _index()
+
+    results = index.search_many(["getUser", "GETUSER", "store"])
+
+    assert list(results) == ["getUser", "GETUSER", "store"]
+    assert results["getUser"] is results["GETUSER"]
+    assert results["store"] == _brute_force(index, "store")